@@ -53,8 +53,7 @@ def apply_filter_logic(df, field, filter_value):
     Returns:
         DataFrame: Filtered DataFrame
     """
-    # Convert column to string for comparison (handles boolean, numeric, etc.)
-    # Use astype(str) instead of .str accessor to handle all types
+    # Columns are read as strings; astype(str) keeps this safe for other callers
     field_values = df[field].astype(str).str.lower()
     
     # Handle OR logic (||)
@@ -69,8 +68,8 @@ def apply_filter_logic(df, field, filter_value):
     
     # Handle AND logic (&&)
     elif '&&' in filter_value:
-        # Split by && and create AND condition
-        and_conditions = [field_values == condition.strip().lower() for condition in filter_value.split('&&')]
+        # Split by && and require the value to contain every term
+        and_conditions = [field_values.str.contains(condition.strip().lower(), regex=False) for condition in filter_value.split('&&')]
         # Combine with AND logic
         combined_condition = and_conditions[0]
         for condition in and_conditions[1:]:
@@ -159,8 +158,10 @@ def filter_csv(input_file, output_file, filter_criteria, chunk_size=50000):
             bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'
         )
         
-        # Process CSV in chunks
-        for chunk in pd.read_csv(str(input_path), chunksize=chunk_size, low_memory=False):
+        # Process CSV in chunks. Every column is read as a plain string: the filter
+        # only compares lowercased text, so per-chunk type inference is wasted work
+        # and would also rewrite values (e.g. "true" -> "True") in the output.
+        for chunk in pd.read_csv(str(input_path), chunksize=chunk_size, dtype=str, keep_default_na=False):
             chunk_num += 1
             chunk_rows = len(chunk)
             total_rows_processed += chunk_rows
@@ -7,6 +7,7 @@ Aggregates SCA package reports from all project-branch combinations in CxOne.
 
 import sys
 import argparse
+import logging
 import time
 from datetime import datetime
 from src.utils.auth import AuthManager
@@ -34,11 +35,32 @@ def parse_args():
     parser.add_argument('--api-key', help='API key for authentication')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
     parser.add_argument('--max-workers', type=int, help='Maximum worker threads for report generation')
+    parser.add_argument('--max-scan-workers', type=int, help='Maximum concurrent requests for scan discovery')
     parser.add_argument('--output-dir', help='Output directory for final CSV')
     parser.add_argument('--retry-failed', help='Path to failed reports CSV file to retry only those scans')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the persistent scan package, HTTP and token caches')
+    parser.add_argument('--clean-orphan-temp', action='store_true', help='Also remove report archives left in the temp directory by earlier runs (do not use while other runs share it)')
+    parser.add_argument('--no-progress', action='store_true', help='Replace progress bars with a plain progress line updated every 1%%')
     parser.add_argument('--filter-packages', help='Filter packages by field=value with OR (||) and AND (&&) logic support. Examples: "PackageRepository=npm", "PackageRepository=npm||pypi", "CriticalVulnerabilityCount>0"')
     return parser.parse_args()
 
+def configure_console_logging(debug):
+    """Route the tool's console debug output through the logging module.
+    
+    Only the `src` package loggers are configured so third-party library
+    debug output (e.g. urllib3) stays silent.
+    
+    Args:
+        debug (bool): Whether debug messages should be printed
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    logger = logging.getLogger('src')
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG if debug else logging.WARNING)
+    logger.propagate = False
+
 def load_failed_scans(failed_csv_path):
     """Load scans from a failed reports CSV file.
     
@@ -110,10 +132,22 @@ def main():
         config.debug = args.debug
     if args.max_workers:
         config.max_workers_reports = args.max_workers
+    if args.max_scan_workers:
+        config.max_workers_scans = args.max_scan_workers
     if args.output_dir:
         config.output_directory = args.output_dir
     if args.filter_packages:
         config.filter_packages = args.filter_packages
+    if args.clean_orphan_temp:
+        config.temp_orphan_cleanup = True
+    if args.no_progress:
+        config.progress_bars = False
+    if args.no_cache:
+        config.cache_path = None
+        config.http_cache_path = None
+        config.token_cache_dir = None
+
+    configure_console_logging(config.debug)
 
     # Validate configuration
     is_valid, error = config.validate()
@@ -128,6 +162,7 @@ def main():
     print(f"Base URL: {config.base_url}")
     print(f"Output Directory: {config.output_directory}")
     print(f"Max Report Workers: {config.max_workers_reports}")
+    print(f"Max Scan Workers: {config.max_workers_scans}")
     if config.filter_packages:
         print(f"Package Filter: {config.filter_packages}")
     print("="*120)
@@ -137,7 +172,8 @@ def main():
         base_url=config.base_url,
         tenant_name=config.tenant_name,
         api_key=config.api_key,
-        debug=config.debug
+        debug=config.debug,
+        token_cache_dir=config.token_cache_dir
     )
 
     try:
@@ -163,7 +199,7 @@ def main():
         debug_logger.log("="*120)
         
         api_client = APIClient(config.base_url, auth_manager, config, config.debug, debug_logger)
-        progress_tracker = ProgressTracker(config.debug)
+        progress_tracker = ProgressTracker(config.debug, plain=not config.progress_bars)
         stage_tracker = StageTracker(config.debug)
         csv_streamer = CSVStreamer(config.debug, debug_logger)
         exception_reporter = ExceptionReporter()
@@ -424,6 +460,10 @@ def main():
             import traceback
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        # Flush persistent caches on every exit path
+        if 'api_client' in locals():
+            api_client.close()
 
 def get_file_size(file_path):
     """Get human-readable file size.
@@ -1,19 +1,20 @@
 """Branch data model."""
 
+from dataclasses import dataclass
+
+@dataclass(frozen=True, slots=True, repr=False)
 class Branch:
-    """Represents a project branch."""
+    """Represents a project branch.
+    
+    Attributes:
+        project_id (str): The project ID
+        project_name (str): The project name
+        branch_name (str): The branch name
+    """
     
-    def __init__(self, project_id, project_name, branch_name):
-        """Initialize a Branch.
-        
-        Args:
-            project_id (str): The project ID
-            project_name (str): The project name
-            branch_name (str): The branch name
-        """
-        self.project_id = project_id
-        self.project_name = project_name
-        self.branch_name = branch_name
+    project_id: str
+    project_name: str
+    branch_name: str
     
     def to_dict(self):
         """Convert to dictionary."""
@@ -1,23 +1,25 @@
 """Scan data model."""
 
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass(frozen=True, slots=True, repr=False)
 class Scan:
-    """Represents a CxOne scan with SCA results."""
+    """Represents a CxOne scan with SCA results.
+    
+    Attributes:
+        scan_id (str): The scan ID
+        project_id (str): The project ID
+        project_name (str): The project name
+        branch_name (str): The branch name
+        created_at (str, optional): Scan creation timestamp
+    """
     
-    def __init__(self, scan_id, project_id, project_name, branch_name, created_at=None):
-        """Initialize a Scan.
-        
-        Args:
-            scan_id (str): The scan ID
-            project_id (str): The project ID
-            project_name (str): The project name
-            branch_name (str): The branch name
-            created_at (str, optional): Scan creation timestamp
-        """
-        self.scan_id = scan_id
-        self.project_id = project_id
-        self.project_name = project_name
-        self.branch_name = branch_name
-        self.created_at = created_at
+    scan_id: str
+    project_id: str
+    project_name: str
+    branch_name: str
+    created_at: Optional[str] = None
     
     def to_dict(self):
         """Convert to dictionary."""
@@ -1,3 +1,7 @@
+import logging
+from concurrent.futures import FIRST_COMPLETED, wait
+from itertools import islice
+
 class Operation:
     """Base class for all operations."""
     
@@ -16,10 +20,61 @@ class Operation:
         self.api_client = api_client
         self.progress = progress
         self.logger = debug_logger
+        # Console debug output; formatting is skipped unless debug is enabled
+        self.log = logging.getLogger(type(self).__module__)
 
     def execute(self):
         """Execute the operation.
         
         This method should be overridden by specific operations.
         """
-        raise NotImplementedError("Operation must implement execute method") 
\ No newline at end of file
+        raise NotImplementedError("Operation must implement execute method")
+    
+    def _update_progress(self, advance=1, **postfix):
+        """Advance the progress bar and hand it the latest postfix values.
+        
+        ProgressTracker throttles how often the postfix is rendered and shows
+        the final values when the bar is closed.
+        
+        Args:
+            advance (int): Number of items completed since the previous call
+            **postfix: Key-value pairs to display
+        """
+        if not self.progress:
+            return
+        
+        self.progress.update(advance)
+        self.progress.set_postfix(**postfix)
+    
+    def _iter_bounded(self, executor, fn, items, *args, window):
+        """Run fn over items with at most `window` tasks in flight.
+        
+        Unlike submitting every item up front, only a small window of futures
+        exists at any time; a new item is submitted as soon as one completes.
+        
+        Args:
+            executor (Executor): Executor to submit tasks to
+            fn (callable): Function called as fn(item, *args)
+            items (iterable): Items to process
+            *args: Extra positional arguments passed to fn
+            window (int): Maximum number of tasks in flight
+            
+        Yields:
+            tuple: (index, item, future) for each completed task, in completion
+                   order, where index is the item's position in `items`
+        """
+        items = enumerate(items)
+        pending = {
+            executor.submit(fn, item, *args): (index, item)
+            for index, item in islice(items, window)
+        }
+        
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            
+            # Refill the window before handing results back so workers stay busy
+            completed = [(*pending.pop(future), future) for future in done]
+            for index, item in islice(items, len(completed)):
+                pending[executor.submit(fn, item, *args)] = (index, item)
+            
+            yield from completed
@@ -23,8 +23,7 @@ class BranchDiscovery(Operation):
         
         if self.logger:
             self.logger.log(f"Discovering branches from scans for {len(projects)} projects...")
-        if self.config.debug:
-            print(f"\nDiscovering branches from scans for {len(projects)} projects...")
+        self.log.debug("\nDiscovering branches from scans for %s projects...", len(projects))
         
         # Use threading for branch discovery
         with ThreadPoolExecutor(max_workers=self.config.max_workers_branches) as executor:
@@ -50,13 +49,11 @@ class BranchDiscovery(Operation):
                 except Exception as e:
                     if self.logger:
                         self.logger.log(f"ERROR: Failed to fetch branches for {project.name}: {e}")
-                    if self.config.debug:
-                        print(f"\nError fetching branches for {project.name}: {e}")
+                    self.log.debug("\nError fetching branches for %s: %s", project.name, e)
         
         if self.logger:
             self.logger.log(f"Found {len(all_branches)} total branches across all projects")
-        if self.config.debug:
-            print(f"\nFound {len(all_branches)} total branches across all projects")
+        self.log.debug("\nFound %s total branches across all projects", len(all_branches))
         
         return all_branches
     
@@ -75,18 +72,18 @@ class BranchDiscovery(Operation):
                 'project-id': project.id
             }
             
-            scans_data = self.api_client.get_paginated('/api/scans', params=params)
-            
-            if not scans_data:
-                return []
-            
-            # Extract unique branch names from scans
+            # Extract unique branch names from scans, one page at a time
             branch_names = set()
-            for scan in scans_data:
+            scan_count = 0
+            for scan in self.api_client.iter_paginated('/api/scans', params=params):
+                scan_count += 1
                 branch_name = scan.get('branch')
                 if branch_name:
                     branch_names.add(branch_name)
             
+            if not scan_count:
+                return []
+            
             # Create Branch objects for each unique branch
             branches = []
             for branch_name in sorted(branch_names):
@@ -98,14 +95,13 @@ class BranchDiscovery(Operation):
                 branches.append(branch)
             
             if self.logger:
-                self.logger.log(f"  Project {project.name}: Found {len(branches)} unique branches from {len(scans_data)} scans")
+                self.logger.log(f"  Project {project.name}: Found {len(branches)} unique branches from {scan_count} scans")
             
             return branches
             
         except Exception as e:
             if self.logger:
                 self.logger.log(f"ERROR: Exception in branch discovery for {project.name}: {e}")
-            if self.config.debug:
-                print(f"\nError fetching branches for {project.name}: {e}")
+            self.log.debug("\nError fetching branches for %s: %s", project.name, e)
             return []
 
@@ -19,8 +19,7 @@ class DataMerger(Operation):
         Returns:
             tuple: (output_path, total_rows, files_processed, files_failed)
         """
-        if self.config.debug:
-            print(f"\nMerging {len(report_metadata)} reports...")
+        self.log.debug("\nMerging %s reports...", len(report_metadata))
         
         # Get output file path
         output_path = file_manager.get_output_file_path()
@@ -31,7 +30,8 @@ class DataMerger(Operation):
             output_path,
             exception_reporter,
             self.config.filter_packages,
-            self.progress
+            self.progress,
+            self.config.max_workers_merge
         )
         
         # Handle both old and new return formats for backward compatibility
@@ -42,15 +42,14 @@ class DataMerger(Operation):
         else:
             total_rows, files_processed, files_failed, total_packages_before_filter, packages_filtered_out = result
         
-        if self.config.debug:
-            print(f"\nData merge completed:")
-            print(f"  - Total packages: {total_rows}")
-            print(f"  - Files processed: {files_processed}")
-            print(f"  - Files failed: {files_failed}")
-            if packages_filtered_out > 0:
-                print(f"  - Packages filtered out: {packages_filtered_out:,}")
-                print(f"  - Total packages before filtering: {total_packages_before_filter:,}")
-            print(f"  - Output: {output_path}")
+        self.log.debug("\nData merge completed:")
+        self.log.debug("  - Total packages: %s", total_rows)
+        self.log.debug("  - Files processed: %s", files_processed)
+        self.log.debug("  - Files failed: %s", files_failed)
+        if packages_filtered_out > 0:
+            self.log.debug("  - Packages filtered out: %s", format(packages_filtered_out, ','))
+            self.log.debug("  - Total packages before filtering: %s", format(total_packages_before_filter, ','))
+        self.log.debug("  - Output: %s", output_path)
         
         return output_path, total_rows, files_processed, files_failed, total_packages_before_filter, packages_filtered_out
 
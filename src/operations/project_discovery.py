@@ -15,25 +15,13 @@ class ProjectDiscovery(Operation):
         """
         if self.logger:
             self.logger.log("Fetching all projects from /api/projects...")
-        if self.config.debug:
-            print("\nFetching all projects...")
+        self.log.debug("\nFetching all projects...")
         
-        # Fetch projects using pagination
-        projects_data = self.api_client.get_paginated('/api/projects')
-        
-        if not projects_data:
-            if self.logger:
-                self.logger.log("No projects found or API error occurred")
-            if self.config.debug:
-                print("No projects found or error occurred")
-            return []
-        
-        if self.logger:
-            self.logger.log(f"Retrieved {len(projects_data)} projects from API")
-        
-        # Convert to Project objects
+        # Fetch projects using pagination, converting each page as it arrives
         projects = []
-        for project_data in projects_data:
+        project_count = 0
+        for project_data in self.api_client.iter_paginated('/api/projects'):
+            project_count += 1
             try:
                 project = Project.from_dict(project_data)
                 projects.append(project)
@@ -42,14 +30,21 @@ class ProjectDiscovery(Operation):
             except Exception as e:
                 if self.logger:
                     self.logger.log(f"ERROR: Failed to parse project: {e}")
-                if self.config.debug:
-                    print(f"Error parsing project: {e}")
+                self.log.debug("Error parsing project: %s", e)
                 continue
         
+        if not project_count:
+            if self.logger:
+                self.logger.log("No projects found or API error occurred")
+            self.log.debug("No projects found or error occurred")
+            return []
+        
+        if self.logger:
+            self.logger.log(f"Retrieved {project_count} projects from API")
+        
         if self.logger:
             self.logger.log(f"Successfully parsed {len(projects)} projects")
-        if self.config.debug:
-            print(f"Found {len(projects)} projects")
+        self.log.debug("Found %s projects", len(projects))
         
         return projects
 
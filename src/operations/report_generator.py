@@ -1,10 +1,37 @@
 """Report generation operation."""
 
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from src.operations.base import Operation
 from src.models.report_metadata import ReportMetadata
 
+# Export ID field names (lowercased), in order of preference
+_EXPORT_ID_KEYS = ('exportid', 'id')
+
+
+def _pick_export_id(response):
+    """Extract the export ID from an export request response.
+    
+    Keys are matched case-insensitively in a single pass over the response,
+    preferring any exportId variant over a plain id.
+    
+    Args:
+        response (dict): Export request response
+        
+    Returns:
+        str: Export ID, or None if not present
+    """
+    found = {}
+    for key, value in response.items():
+        lowered = key.lower()
+        if value and lowered in _EXPORT_ID_KEYS:
+            found.setdefault(lowered, value)
+    
+    for key in _EXPORT_ID_KEYS:
+        if key in found:
+            return found[key]
+    return None
+
 class ReportGenerator(Operation):
     """Generate and download SCA reports."""
     
@@ -20,113 +47,117 @@ class ReportGenerator(Operation):
             list: List of (file_path, metadata_dict) tuples
                   where metadata_dict has: project_name, project_id, branch_name, scan_id, scan_date
         """
-        report_metadata = []
+        # Results are written by submission index, so the list never grows
+        report_metadata = [None] * len(scans)
         success_count = 0
         failed_count = 0
         self.exception_reporter = exception_reporter
         
         if self.logger:
             self.logger.log(f"Generating SCA reports for {len(scans)} scans with {self.config.max_workers_reports} workers...")
-        if self.config.debug:
-            print(f"\nGenerating SCA reports for {len(scans)} scans...")
+        self.log.debug("\nGenerating SCA reports for %s scans...", len(scans))
         
         # Use threading with rate limiting for report generation
         with ThreadPoolExecutor(max_workers=self.config.max_workers_reports) as executor:
-            # Submit all tasks
-            future_to_scan = {
-                executor.submit(self._generate_and_download_report, scan, file_manager): scan
-                for scan in scans
-            }
+            # Keep only a small window of tasks in flight instead of queueing every scan
+            completions = self._iter_bounded(
+                executor, self._generate_with_retries, scans, file_manager,
+                window=2 * self.config.max_workers_reports
+            )
             
             # Process completed tasks
-            for future in as_completed(future_to_scan):
-                scan = future_to_scan[future]
+            for index, scan, future in completions:
                 try:
                     result = future.result()
                     file_path, metadata = result
-                    report_metadata.append((file_path, metadata))
+                    report_metadata[index] = (file_path, metadata)
                     success_count += 1
                     if self.logger:
                         self.logger.log(f"  ✓ Report generated for {scan.project_name}/{scan.branch_name} (scan: {scan.scan_id})")
                     
-                    if self.progress:
-                        self.progress.update(1)
-                        self.progress.set_postfix(
-                            generated=success_count,
-                            failed=failed_count
-                        )
+                    self._update_progress(
+                        generated=success_count,
+                        failed=failed_count
+                    )
                         
                 except Exception as e:
-                    # Automatic retry up to 3 times
-                    retry_success = False
-                    last_error = str(e)
-                    
+                    # Retries already ran in the worker; this scan has failed for good
+                    failed_count += 1
                     if self.logger:
-                        self.logger.log(f"  ✗ Initial attempt failed for {scan.project_name}/{scan.branch_name} (scan: {scan.scan_id}): {e}")
+                        self.logger.log(f"  ✗✗ FAILED after 4 attempts for {scan.project_name}/{scan.branch_name} (scan: {scan.scan_id}): {e}")
+                    self.log.debug("\n✗ All retry attempts exhausted for scan %s", scan.scan_id)
                     
-                    for retry_attempt in range(1, 4):  # Retry 3 times (attempts 2, 3, 4)
-                        if self.logger:
-                            self.logger.log(f"     RETRY {retry_attempt}/3 for scan {scan.scan_id}")
-                        if self.config.debug:
-                            print(f"\nRetrying report generation for scan {scan.scan_id} (attempt {retry_attempt + 1}/4)")
-                        
-                        try:
-                            result = self._generate_and_download_report(scan, file_manager)
-                            file_path, metadata = result
-                            report_metadata.append((file_path, metadata))
-                            success_count += 1
-                            retry_success = True
-                            
-                            if self.logger:
-                                self.logger.log(f"     ✓ Retry {retry_attempt} SUCCESSFUL for scan {scan.scan_id}")
-                            if self.config.debug:
-                                print(f"\n✓ Retry successful on attempt {retry_attempt + 1} for scan {scan.scan_id}")
-                            
-                            break  # Success, exit retry loop
-                            
-                        except Exception as retry_error:
-                            last_error = str(retry_error)
-                            if self.logger:
-                                self.logger.log(f"     ✗ Retry {retry_attempt} failed for scan {scan.scan_id}: {retry_error}")
-                            if self.config.debug:
-                                print(f"\nRetry attempt {retry_attempt + 1} failed for scan {scan.scan_id}: {retry_error}")
-                            continue
-                    
-                    # If all retries failed
-                    if not retry_success:
-                        failed_count += 1
-                        if self.logger:
-                            self.logger.log(f"  ✗✗ FAILED after 4 attempts for {scan.project_name}/{scan.branch_name} (scan: {scan.scan_id}): {last_error}")
-                        if self.config.debug:
-                            print(f"\n✗ All retry attempts exhausted for scan {scan.scan_id}")
-                        
-                        # Report generation error with full metadata
-                        if self.exception_reporter:
-                            self.exception_reporter.add_report_generation_error(
-                                project_name=scan.project_name,
-                                project_id=scan.project_id,
-                                branch_name=scan.branch_name,
-                                scan_id=scan.scan_id,
-                                scan_date=scan.created_at,
-                                error_message=f"Failed after 4 attempts. Last error: {last_error}"
-                            )
-                    
-                    if self.progress:
-                        self.progress.update(1)
-                        self.progress.set_postfix(
-                            generated=success_count,
-                            failed=failed_count
+                    # Report generation error with full metadata
+                    if self.exception_reporter:
+                        self.exception_reporter.add_report_generation_error(
+                            project_name=scan.project_name,
+                            project_id=scan.project_id,
+                            branch_name=scan.branch_name,
+                            scan_id=scan.scan_id,
+                            scan_date=scan.created_at,
+                            error_message=f"Failed after 4 attempts. Last error: {e}"
                         )
+                    
+                    self._update_progress(
+                        generated=success_count,
+                        failed=failed_count
+                    )
+        
+        # Drop slots for scans whose reports failed
+        report_metadata = [entry for entry in report_metadata if entry is not None]
         
         if self.logger:
             self.logger.log(f"Report generation completed: {success_count} generated, {failed_count} failed")
-        if self.config.debug:
-            print(f"\nReport generation completed:")
-            print(f"  - Generated: {success_count}")
-            print(f"  - Failed: {failed_count}")
+        self.log.debug("\nReport generation completed:")
+        self.log.debug("  - Generated: %s", success_count)
+        self.log.debug("  - Failed: %s", failed_count)
         
         return report_metadata
     
+    def _generate_with_retries(self, scan, file_manager):
+        """Generate and download a report, retrying up to 3 times on failure.
+        
+        Runs in the worker thread, so a scan that needs retries (each one a new
+        export and its polling) does not hold up the submission of other scans.
+        
+        Args:
+            scan (Scan): Scan object
+            file_manager (FileManager): File manager instance
+            
+        Returns:
+            tuple: (file_path, metadata_dict) from the first successful attempt
+            
+        Raises:
+            Exception: The last error once all 4 attempts have failed
+        """
+        try:
+            return self._generate_and_download_report(scan, file_manager)
+        except Exception as e:
+            last_error = e
+            if self.logger:
+                self.logger.log(f"  ✗ Initial attempt failed for {scan.project_name}/{scan.branch_name} (scan: {scan.scan_id}): {e}")
+        
+        for retry_attempt in range(1, 4):  # Retry 3 times (attempts 2, 3, 4)
+            if self.logger:
+                self.logger.log(f"     RETRY {retry_attempt}/3 for scan {scan.scan_id}")
+            self.log.debug("\nRetrying report generation for scan %s (attempt %s/4)", scan.scan_id, retry_attempt + 1)
+            
+            try:
+                result = self._generate_and_download_report(scan, file_manager)
+            except Exception as retry_error:
+                last_error = retry_error
+                if self.logger:
+                    self.logger.log(f"     ✗ Retry {retry_attempt} failed for scan {scan.scan_id}: {retry_error}")
+                self.log.debug("\nRetry attempt %s failed for scan %s: %s", retry_attempt + 1, scan.scan_id, retry_error)
+                continue
+            
+            if self.logger:
+                self.logger.log(f"     ✓ Retry {retry_attempt} SUCCESSFUL for scan {scan.scan_id}")
+            self.log.debug("\n✓ Retry successful on attempt %s for scan %s", retry_attempt + 1, scan.scan_id)
+            return result
+        
+        raise last_error
+    
     def _generate_and_download_report(self, scan, file_manager):
         """Generate and download a single SCA report.
         
@@ -159,16 +190,10 @@ class ReportGenerator(Operation):
         # Debug: Print full response to understand structure
         if self.logger:
             self.logger.log(f"  Export request response for scan {scan.scan_id}: {response}")
-        if self.config.debug:
-            print(f"\nSCA Export Response: {response}")
+        self.log.debug("\nSCA Export Response: %s", response)
         
         # Extract export ID from response - try multiple possible field names
-        export_id = (response.get('exportId') or 
-                    response.get('ExportId') or
-                    response.get('exportID') or
-                    response.get('ExportID') or
-                    response.get('id') or
-                    response.get('Id'))
+        export_id = _pick_export_id(response)
         
         if not export_id:
             raise Exception(f"No exportId in API response. Response keys: {list(response.keys())}")
@@ -184,10 +209,9 @@ class ReportGenerator(Operation):
         # The fileUrl contains the full URL path, extract just the path part
         # fileUrl format: "https://ast.checkmarx.net/api/sca/export/requests/{exportId}/download"
         if file_url.startswith('http'):
-            # Extract path from full URL
-            from urllib.parse import urlparse
-            parsed = urlparse(file_url)
-            download_endpoint = parsed.path
+            # Extract path from full URL: ['https:', '', host, path]
+            url_parts = file_url.split('/', 3)
+            download_endpoint = '/' + url_parts[3] if len(url_parts) > 3 else '/'
         else:
             download_endpoint = file_url
         
@@ -239,7 +263,7 @@ class ReportGenerator(Operation):
             try:
                 # Status check endpoint with query parameter
                 status_endpoint = f'/api/sca/export/requests?exportId={export_id}'
-                response = self.api_client.get(status_endpoint)  # nosec B113 - export_id from our API
+                response = self.api_client.get(status_endpoint, use_cache=False)  # nosec B113 - export_id from our API
                 
                 if not response:
                     # Wait before retry with exponential backoff
@@ -255,16 +279,14 @@ class ReportGenerator(Operation):
                 if attempt == 0:
                     if self.logger:
                         self.logger.log(f"  Export {export_id} initial status: {status}")
-                    if self.config.debug:
-                        print(f"\nExport {export_id} initial status: {status}")
+                    self.log.debug("\nExport %s initial status: %s", export_id, status)
                 
                 if status == 'completed':
                     # Return the fileUrl for downloading
                     file_url = response.get('fileUrl')
                     if self.logger:
                         self.logger.log(f"  Export {export_id} completed after {elapsed:.1f}s")
-                    if self.config.debug:
-                        print(f"\nExport {export_id} completed after {elapsed:.1f}s")
+                    self.log.debug("\nExport %s completed after %.1fs", export_id, elapsed)
                     if file_url:
                         return file_url
                     else:
@@ -281,8 +303,7 @@ class ReportGenerator(Operation):
                 if attempt % 10 == 0 and attempt > 0:
                     if self.logger:
                         self.logger.log(f"  Export {export_id} still processing... (elapsed: {elapsed/60:.1f}m, next wait: {wait_time}s)")
-                    if self.config.debug:
-                        print(f"\nExport {export_id} still processing... (elapsed: {elapsed/60:.1f}m, wait: {wait_time}s)")
+                    self.log.debug("\nExport %s still processing... (elapsed: %.1fm, wait: %ss)", export_id, elapsed / 60, wait_time)
                 
                 time.sleep(wait_time)  # nosec B311 - intentional polling delay
                 
@@ -295,8 +316,7 @@ class ReportGenerator(Operation):
                 if "Export failed with status" in str(e) or "Export timed out" in str(e):
                     raise
                 # Otherwise, log and retry
-                if self.config.debug:
-                    print(f"\nError checking export status: {e}")
+                self.log.debug("\nError checking export status: %s", e)
                 time.sleep(wait_time)  # nosec B311 - intentional polling delay
                 wait_time = min(wait_time * 2, self.config.polling_max_wait)
                 attempt += 1
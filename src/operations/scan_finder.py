@@ -1,12 +1,52 @@
 """Scan finder operation."""
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import shelve
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
 from src.operations.base import Operation
 from src.models.scan import Scan
 
+
+def _engine_names(engines):
+    """Build the set of lowercased engine names for a scan.
+    
+    Handles both string array and object array formats.
+    
+    Args:
+        engines (list): Engines from scan data
+        
+    Returns:
+        set: Lowercased engine names
+    """
+    return {
+        (engine if isinstance(engine, str) else engine.get('name', '') or '').lower()
+        for engine in engines or ()
+        if isinstance(engine, (str, dict))
+    }
+
 class ScanFinder(Operation):
     """Find the most recent SCA scan for each project-branch combination."""
     
+    def __init__(self, config, auth_manager, api_client=None, progress=None, debug_logger=None):
+        """Initialize the scan finder.
+        
+        Args:
+            config (Config): Configuration instance
+            auth_manager (AuthManager): Authentication manager instance
+            api_client (APIClient, optional): API client instance
+            progress (ProgressTracker, optional): Progress tracker instance
+            debug_logger (DebugLogger, optional): Debug logger instance
+        """
+        super().__init__(config, auth_manager, api_client, progress, debug_logger)
+        # The static part of every scan query (statuses, sort order, page size)
+        self._static_scan_query = urlencode({
+            'statuses': 'Completed,Partial',
+            'sort': '-created_at',
+            'limit': config.page_size  # Fetch in pages
+        })
+    
     def execute(self, branches, exception_reporter=None):
         """Execute scan finding for all branches.
         
@@ -17,75 +57,152 @@ class ScanFinder(Operation):
         Returns:
             list: List of Scan objects with SCA results
         """
-        scans_found = []
+        # Results are written by submission index, so the list never grows
+        scans_found = [None] * len(branches)
+        found_count = 0
         not_found_count = 0
         error_count = 0
         
         if self.logger:
             self.logger.log(f"Finding latest SCA scans for {len(branches)} branches...")
-        if self.config.debug:
-            print(f"\nFinding latest SCA scans for {len(branches)} branches...")
-        
-        # Use threading for scan discovery
-        with ThreadPoolExecutor(max_workers=self.config.max_workers_scans) as executor:
-            # Submit all tasks
-            future_to_branch = {
-                executor.submit(self._find_latest_sca_scan, branch): branch
-                for branch in branches
-            }
+        self.log.debug("\nFinding latest SCA scans for %s branches...", len(branches))
+        
+        # Scan IDs are immutable, so package results can be cached across runs
+        self._open_package_cache()
+        
+        try:
+            # Group branches by project so each project's scans can be listed once
+            groups = {}
+            for index, branch in enumerate(branches):
+                groups.setdefault(branch.project_id, []).append((index, branch))
             
-            # Process completed tasks
-            for future in as_completed(future_to_branch):
-                branch = future_to_branch[future]
-                try:
-                    scan = future.result()
+            # Use threading for scan discovery
+            with ThreadPoolExecutor(max_workers=self.config.max_workers_scans) as executor:
+                # Keep the executor queue full without holding a future per project
+                completions = self._iter_bounded(
+                    executor, self._find_latest_sca_scans, list(groups.values()),
+                    window=4 * self.config.max_workers_scans
+                )
+                
+                # Process completed tasks
+                for _, group, future in completions:
+                    try:
+                        results = future.result()
+                        group_error = None
+                    except Exception as e:
+                        results = [None] * len(group)
+                        group_error = e
                     
-                    if scan:
-                        scans_found.append(scan)
-                        if self.logger:
-                            self.logger.log(f"  ✓ Found SCA scan for {branch.project_name}/{branch.branch_name}: {scan.scan_id}")
-                    else:
-                        not_found_count += 1
-                        if self.logger:
-                            self.logger.log(f"  ✗ No SCA scan found for {branch.project_name}/{branch.branch_name}")
-                        # Report branch with no SCA scan
-                        if exception_reporter:
-                            exception_reporter.add_branch_no_sca(branch.project_name, branch.branch_name)
+                    # Log lines for the whole project are written in one batch
+                    log_lines = [] if self.logger else None
                     
-                    if self.progress:
-                        self.progress.update(1)
-                        self.progress.set_postfix(
-                            found=len(scans_found),
-                            not_found=not_found_count
-                        )
-                        
-                except Exception as e:
-                    error_count += 1
-                    if self.logger:
-                        self.logger.log(f"ERROR: Failed to find scan for {branch.project_name}/{branch.branch_name}: {e}")
-                    if self.config.debug:
-                        print(f"\nError finding scan for {branch.project_name}/{branch.branch_name}: {e}")
-                    # Report scan error
-                    if exception_reporter:
-                        exception_reporter.add_scan_error(branch.project_name, branch.branch_name, str(e))
+                    for (index, branch), scan in zip(group, results):
+                        if group_error:
+                            error_count += 1
+                            if log_lines is not None:
+                                log_lines.append(f"ERROR: Failed to find scan for {branch.project_name}/{branch.branch_name}: {group_error}")
+                            self.log.debug("\nError finding scan for %s/%s: %s", branch.project_name, branch.branch_name, group_error)
+                            # Report scan error
+                            if exception_reporter:
+                                exception_reporter.add_scan_error(branch.project_name, branch.branch_name, str(group_error))
+                        elif scan:
+                            scans_found[index] = scan
+                            found_count += 1
+                            if log_lines is not None:
+                                log_lines.append(f"  ✓ Found SCA scan for {branch.project_name}/{branch.branch_name}: {scan.scan_id}")
+                        else:
+                            not_found_count += 1
+                            if log_lines is not None:
+                                log_lines.append(f"  ✗ No SCA scan found for {branch.project_name}/{branch.branch_name}")
+                            # Report branch with no SCA scan
+                            if exception_reporter:
+                                exception_reporter.add_branch_no_sca(branch.project_name, branch.branch_name)
                     
-                    if self.progress:
-                        self.progress.update(1)
-                        self.progress.set_postfix(
-                            found=len(scans_found),
-                            not_found=not_found_count
-                        )
+                    if log_lines:
+                        self.logger.log_many(log_lines)
+                    
+                    self._update_progress(
+                        advance=len(group),
+                        found=found_count,
+                        not_found=not_found_count
+                    )
+        finally:
+            # Closing writes the index for dbm backends that only save on close
+            self._close_package_cache()
+        
+        # Drop slots for branches without a scan
+        scans_found = [scan for scan in scans_found if scan is not None]
         
         if self.logger:
             self.logger.log(f"Scan discovery completed: {len(scans_found)} found, {not_found_count} not found, {error_count} errors")
-        if self.config.debug:
-            print(f"\nScan discovery completed:")
-            print(f"  - Scans found: {len(scans_found)}")
-            print(f"  - Not found (no SCA): {not_found_count}")
-            print(f"  - Errors: {error_count}")
+        self.log.debug("\nScan discovery completed:")
+        self.log.debug("  - Scans found: %s", len(scans_found))
+        self.log.debug("  - Not found (no SCA): %s", not_found_count)
+        self.log.debug("  - Errors: %s", error_count)
         
         return scans_found
     
+    def _find_latest_sca_scans(self, group):
+        """Find the most recent completed SCA scan for each branch of a project.
+        
+        For projects with several branches, the project's Completed/Partial
+        scans are listed once (newest first) and each branch takes the first
+        valid SCA scan seen for it, instead of issuing one query per branch.
+        The walk is capped at `scan_batch_max_pages` pages; branches still
+        unresolved after that, or after a failed page request, fall back to a
+        per-branch query.
+        
+        Args:
+            group (list): (index, Branch) tuples sharing one project
+            
+        Returns:
+            list: Scan object or None for each branch, in group order
+        """
+        branches = [branch for _, branch in group]
+        if len(branches) == 1:
+            return [self._find_latest_sca_scan(branches[0])]
+        
+        pending = {branch.branch_name for branch in branches}
+        resolved = {}
+        exhausted = False
+        
+        try:
+            query = self._scan_query({'project-id': branches[0].project_id})
+            
+            # Only a short final page proves a branch has no SCA scan; a failed
+            # request or the page cap leaves the rest to the per-branch query
+            for scans_list in self._iter_scan_pages(query, max_pages=self.config.scan_batch_max_pages):
+                if scans_list is None:
+                    break
+                
+                for scan_data in scans_list:
+                    branch_name = scan_data.get('branch')
+                    if branch_name not in pending:
+                        continue
+                    scan = self._find_first_valid_sca_scan([scan_data])
+                    if scan:
+                        resolved[branch_name] = scan
+                        pending.discard(branch_name)
+                
+                if not pending:
+                    break
+                if len(scans_list) < self.config.page_size:
+                    exhausted = True
+                    break
+        
+        except Exception as e:
+            exhausted = False
+            self.log.debug("\nError querying scans for project %s: %s", branches[0].project_name, e)
+        
+        if pending and not exhausted:
+            if self.logger:
+                self.logger.log(f"  Project {branches[0].project_name}: {len(pending)} branches unresolved from project scan list, querying per branch")
+            for branch in branches:
+                if branch.branch_name in pending:
+                    resolved[branch.branch_name] = self._find_latest_sca_scan(branch)
+        
+        return [resolved.get(branch.branch_name) for branch in branches]
+    
     def _find_latest_sca_scan(self, branch):
         """Find the most recent completed SCA scan for a branch.
         
@@ -103,30 +220,13 @@ class ScanFinder(Operation):
             # Query scans API with filters - include both Completed and Partial
             # Note: We use pagination to find the first valid SCA scan efficiently.
             # Since results are sorted by -created_at, we'll find the most recent first.
-            params = {
+            query = self._scan_query({
                 'project-id': branch.project_id,
-                'branch': branch.branch_name,
-                'statuses': 'Completed,Partial',
-                'sort': '-created_at',
-                'limit': self.config.page_size,  # Fetch in pages
-                'offset': 0
-            }
+                'branch': branch.branch_name
+            })
             
             # Paginate manually to stop as soon as we find a valid SCA scan
-            while True:
-                response_data = self.api_client.get('/api/scans', params=params)
-                
-                if not response_data:
-                    return None
-                
-                # Handle different response formats
-                if isinstance(response_data, dict):
-                    scans_list = response_data.get('scans', [])
-                elif isinstance(response_data, list):
-                    scans_list = response_data
-                else:
-                    return None
-                
+            for scans_list in self._iter_scan_pages(query):
                 if not scans_list:
                     return None
                 
@@ -134,18 +234,95 @@ class ScanFinder(Operation):
                 valid_scan = self._find_first_valid_sca_scan(scans_list)
                 if valid_scan:
                     return valid_scan
-                
-                # If page wasn't full, we've reached the end
-                if len(scans_list) < self.config.page_size:
-                    return None
-                
-                # Move to next page
-                params['offset'] += self.config.page_size
+            
+            return None
         
         except Exception as e:
-            if self.config.debug:
-                print(f"\nError querying scans for {branch.project_name}/{branch.branch_name}: {e}")
+            self.log.debug("\nError querying scans for %s/%s: %s", branch.project_name, branch.branch_name, e)
+            return None
+    
+    def _scan_query(self, filters):
+        """Encode a scan query string for the given project/branch filters.
+        
+        The static part (statuses, sort order, page size) is encoded once in
+        __init__ and reused for every query.
+        
+        Args:
+            filters (dict): Project/branch specific parameters
+            
+        Returns:
+            str: URL-encoded query string, without offset
+        """
+        return f"{urlencode(filters)}&{self._static_scan_query}"
+    
+    def _iter_scan_pages(self, query, max_pages=None):
+        """Yield pages of scans in order until a short, empty or failed page is reached.
+        
+        The first page is fetched on its own since most branches have a valid
+        SCA scan on it. After that, `scan_page_prefetch` pages are requested
+        concurrently so deep branches pay one round trip per batch instead of
+        one per page. Pages still in flight are abandoned once the caller stops.
+        
+        Args:
+            query (str): Encoded scan query (without offset)
+            max_pages (int, optional): Stop after this many pages without
+                                       requesting any further ones
+            
+        Yields:
+            list: Scan data for each page, or None if its request failed
+        """
+        page_size = self.config.page_size
+        prefetch = max(1, self.config.scan_page_prefetch)
+        offset = 0
+        batch = 1
+        
+        while True:
+            if max_pages is not None:
+                batch = min(batch, max_pages - offset // page_size)
+                if batch <= 0:
+                    return
+            offsets = [offset + i * page_size for i in range(batch)]
+            executor = None
+            if batch == 1:
+                pages = [self._fetch_scan_page(query, offsets[0])]
+            else:
+                executor = ThreadPoolExecutor(max_workers=batch)
+                pages = executor.map(lambda page_offset: self._fetch_scan_page(query, page_offset), offsets)
+            
+            try:
+                for page in pages:
+                    yield page
+                    # If the request failed or the page wasn't full, stop here
+                    if page is None or len(page) < page_size:
+                        return
+            finally:
+                if executor:
+                    executor.shutdown(wait=False, cancel_futures=True)
+            
+            offset += batch * page_size
+            batch = prefetch
+    
+    def _fetch_scan_page(self, query, offset):
+        """Fetch a single page of scans.
+        
+        Args:
+            query (str): Encoded scan query (without offset)
+            offset (int): Page offset
+            
+        Returns:
+            list: Scan data, empty if the API returned nothing usable, or
+                  None if the request failed
+        """
+        response_data = self.api_client.get_scans(query, offset)
+        if response_data is None:
             return None
+        
+        # Handle different response formats
+        if isinstance(response_data, dict):
+            return response_data.get('scans', [])
+        elif isinstance(response_data, list):
+            return response_data
+        return []
     
     def _find_first_valid_sca_scan(self, scans_list):
         """Find the first valid SCA scan from a list of scans.
@@ -159,23 +336,7 @@ class ScanFinder(Operation):
         # Find first scan with SCA results
         for scan_data in scans_list:
             # Check if scan has SCA engine
-            engines = scan_data.get('engines', [])
-            
-            # Handle both string array and object array formats
-            has_sca = False
-            if engines:
-                for engine in engines:
-                    if isinstance(engine, str):
-                        if engine.lower() == 'sca':
-                            has_sca = True
-                            break
-                    elif isinstance(engine, dict):
-                        engine_name = engine.get('name', '').lower()
-                        if engine_name == 'sca':
-                            has_sca = True
-                            break
-            
-            if not has_sca:
+            if 'sca' not in _engine_names(scan_data.get('engines')):
                 continue
             
             # For Partial scans, verify SCA specifically completed
@@ -184,8 +345,7 @@ class ScanFinder(Operation):
                 if not self._is_sca_completed(scan_data):
                     if self.logger:
                         self.logger.log(f"  Skipping Partial scan {scan_data.get('id')} - SCA did not complete")
-                    if self.config.debug:
-                        print(f"\nSkipping Partial scan {scan_data.get('id')} - SCA did not complete")
+                    self.log.debug("\nSkipping Partial scan %s - SCA did not complete", scan_data.get('id'))
                     continue
             
             # Check if scan has actual package results
@@ -193,8 +353,7 @@ class ScanFinder(Operation):
             if not self._has_package_results(scan_id):
                 if self.logger:
                     self.logger.log(f"  Skipping scan {scan_id} - No package results found")
-                if self.config.debug:
-                    print(f"\nSkipping scan {scan_id} - No package results")
+                self.log.debug("\nSkipping scan %s - No package results", scan_id)
                 continue
             
             # Valid SCA scan found - need to extract branch info from scan_data
@@ -219,15 +378,11 @@ class ScanFinder(Operation):
         Returns:
             bool: True if SCA completed, False otherwise
         """
-        status_details = scan_data.get('statusDetails', [])
-        
-        for detail in status_details:
-            if detail.get('name', '').lower() == 'sca':
-                sca_status = detail.get('status', '')
-                return sca_status == 'Completed'
-        
         # If no SCA statusDetails found, assume not completed
-        return False
+        return any(
+            detail.get('name', '').lower() == 'sca' and detail.get('status') == 'Completed'
+            for detail in scan_data.get('statusDetails') or ()
+        )
     
     def _has_package_results(self, scan_id):
         """Check if a scan has actual package results.
@@ -240,6 +395,12 @@ class ScanFinder(Operation):
         Returns:
             bool: True if scan has packages, False otherwise
         """
+        cached = self._get_cached_package_result(scan_id)
+        if cached is not None:
+            if self.logger:
+                self.logger.log(f"  Scan {scan_id} package result loaded from cache: {cached}")
+            return cached
+        
         try:
             # Call scan-summary endpoint with the scan ID
             # Endpoint: GET /api/scan-summary?scan-ids={scan_id}
@@ -268,13 +429,87 @@ class ScanFinder(Operation):
             if self.logger:
                 self.logger.log(f"  Scan {scan_id} has {total_packages} packages")
             
-            return total_packages > 0
+            has_packages = total_packages > 0
+            self._store_cached_package_result(scan_id, has_packages)
+            return has_packages
             
         except Exception as e:
             if self.logger:
                 self.logger.log(f"  ERROR: Failed to check package results for scan {scan_id}: {e}")
-            if self.config.debug:
-                print(f"\nError checking package results for scan {scan_id}: {e}")
+            self.log.debug("\nError checking package results for scan %s: %s", scan_id, e)
             # If we can't check due to error, assume it has packages to avoid false negatives
             return True
+    
+    def _open_package_cache(self):
+        """Open the persistent scan-id -> has-packages cache.
+        
+        The cache is optional; if it cannot be opened, package checks simply
+        fall back to the scan-summary API.
+        """
+        self._pkg_cache = None
+        self._pkg_cache_lock = threading.Lock()
+        
+        if not self.config.cache_path:
+            return
+        
+        try:
+            cache_dir = os.path.dirname(self.config.cache_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            self._pkg_cache = shelve.open(self.config.cache_path)  # nosec B301 - local cache written by this tool
+            if self.logger:
+                self.logger.log(f"Scan package cache opened: {self.config.cache_path} ({len(self._pkg_cache)} entries)")
+        except Exception as e:
+            if self.logger:
+                self.logger.log(f"WARNING: Could not open scan package cache {self.config.cache_path}: {e}")
+            self.log.debug("\nWarning: Could not open scan package cache: %s", e)
+            self._pkg_cache = None
+    
+    def _close_package_cache(self):
+        """Flush and close the persistent package cache."""
+        if getattr(self, '_pkg_cache', None) is None:
+            return
+        
+        with self._pkg_cache_lock:
+            try:
+                self._pkg_cache.close()
+            except Exception as e:
+                if self.logger:
+                    self.logger.log(f"WARNING: Failed to close scan package cache: {e}")
+            self._pkg_cache = None
+    
+    def _get_cached_package_result(self, scan_id):
+        """Look up a cached package result for a scan.
+        
+        Args:
+            scan_id (str): Scan ID to look up
+            
+        Returns:
+            bool: Cached result, or None if not cached
+        """
+        if getattr(self, '_pkg_cache', None) is None or not scan_id:
+            return None
+        
+        with self._pkg_cache_lock:
+            try:
+                return self._pkg_cache.get(str(scan_id))
+            except Exception:
+                return None
+    
+    def _store_cached_package_result(self, scan_id, has_packages):
+        """Store a package result in the persistent cache.
+        
+        Args:
+            scan_id (str): Scan ID
+            has_packages (bool): Whether the scan has package results
+        """
+        if getattr(self, '_pkg_cache', None) is None or not scan_id:
+            return
+        
+        with self._pkg_cache_lock:
+            try:
+                self._pkg_cache[str(scan_id)] = has_packages
+            except Exception as e:
+                if self.logger:
+                    self.logger.log(f"WARNING: Failed to cache package result for scan {scan_id}: {e}")
 
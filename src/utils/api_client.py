@@ -1,10 +1,28 @@
 """API client with pagination and retry logic."""
 
+import shutil
 import time
-import sys
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from src.utils.http_cache import HTTPCache
+from src.utils.rate_limiter import RateLimiter, parse_retry_after
 from typing import List, Dict, Any, Optional
 
+
+def _decode_json(response):
+    """Decode a JSON response body with orjson.
+    
+    Args:
+        response (requests.Response): HTTP response
+        
+    Returns:
+        dict or list: Decoded data, or None for an empty body
+    """
+    content = response.content
+    return orjson.loads(content) if content else None
+
 class APIClient:
     """HTTP client for CxOne API with pagination and retry support."""
     
@@ -23,6 +41,54 @@ class APIClient:
         self.config = config
         self.debug = debug
         self.logger = debug_logger
+        self._ensured_dirs = set()  # Output directories already created by download_file
+        self._scans_url = f"{base_url}/api/scans"
+        
+        # Keep-alive session shared by all worker threads so requests reuse
+        # pooled TCP/TLS connections instead of reconnecting per call.
+        # The pool is sized for the busiest stage (scan discovery with page
+        # prefetch) and blocks when exhausted, so surplus requests wait for a
+        # pooled connection rather than opening throwaway ones with a fresh
+        # TLS handshake.
+        pool_size = max(
+            config.max_workers_branches,
+            config.max_workers_scans * max(1, config.scan_page_prefetch),
+            config.max_workers_reports
+        )
+        # Transient failures are retried inside urllib3; max_retries counts the
+        # first attempt, as it always has. 429 is left to _request so the
+        # shared rate limiter sees it.
+        retry = Retry(
+            total=max(0, config.max_retries - 1),
+            backoff_factor=config.retry_delay,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({'GET', 'POST'}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry, pool_block=True)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Scan/project pages are JSON and compress well; requests decodes transparently
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        
+        # Request rate shared by all worker threads; backs off on 429 responses
+        self.rate_limiter = RateLimiter(config.max_requests_per_second, cooldown=config.rate_limit_cooldown)
+        
+        # ETag cache so repeated GETs across runs can be answered with 304 Not Modified
+        self.http_cache = None
+        if config.http_cache_path:
+            try:
+                self.http_cache = HTTPCache(config.http_cache_path, debug, config.http_cache_max_entries)
+            except Exception as e:
+                if self.logger:
+                    self.logger.log(f"WARNING: Could not open HTTP cache {config.http_cache_path}: {e}")
+                if self.debug:
+                    print(f"Warning: Could not open HTTP cache: {e}")
     
     def get_paginated(self, endpoint, params=None, max_results=None):
         """Fetch all results from a paginated endpoint.
@@ -35,15 +101,31 @@ class APIClient:
         Returns:
             list: All results from paginated responses
         """
-        all_results = []
+        return list(self.iter_paginated(endpoint, params, max_results))
+    
+    def iter_paginated(self, endpoint, params=None, max_results=None):
+        """Iterate over results from a paginated endpoint one page at a time.
+        
+        Only the current page is held in memory, so callers that aggregate or
+        filter results do not need to materialize every page.
+        
+        Args:
+            endpoint (str): API endpoint path
+            params (dict, optional): Query parameters
+            max_results (int, optional): Maximum number of results to yield
+            
+        Yields:
+            dict: Each result item
+        """
+        total = 0
         offset = 0
         limit = self.config.page_size
-        params = params or {}
+        
+        # Build the query once; only the offset changes between pages
+        page_params = dict(params or ())
+        page_params['limit'] = limit
         
         while True:
-            # Add pagination parameters
-            page_params = params.copy()
-            page_params['limit'] = limit
             page_params['offset'] = offset
             
             if self.logger:
@@ -78,90 +160,73 @@ class APIClient:
             if not results:
                 break
             
-            all_results.extend(results)
+            # Check if we've reached max results
+            if max_results and total + len(results) >= max_results:
+                yield from results[:max_results - total]
+                break
+            
+            yield from results
+            total += len(results)
             
             if self.logger:
-                self.logger.log(f"API: Retrieved {len(results)} items (total so far: {len(all_results)})")
+                self.logger.log(f"API: Retrieved {len(results)} items (total so far: {total})")
             if self.debug:
-                print(f"    Retrieved {len(results)} items (total: {len(all_results)})")
-            
-            # Check if we've reached max results
-            if max_results and len(all_results) >= max_results:
-                all_results = all_results[:max_results]
-                break
+                print(f"    Retrieved {len(results)} items (total: {total})")
             
             # Check if we've reached the end
             if len(results) < limit:
                 break
             
             offset += limit
-        
-        return all_results
     
-    def get(self, endpoint, params=None):
+    def get(self, endpoint, params=None, use_cache=True):
         """Make a GET request with retry logic.
         
+        When the HTTP cache is enabled, responses carrying an ETag are stored
+        and later requests are sent with If-None-Match; a 304 reply is served
+        from the cached body.
+        
         Args:
             endpoint (str): API endpoint path
             params (dict, optional): Query parameters
+            use_cache (bool): Whether to use the ETag cache for this request
             
         Returns:
             dict or list: Response data
         """
-        url = f"{self.base_url}{endpoint}"
+        return self._get_url(f"{self.base_url}{endpoint}", params, use_cache)
+    
+    def get_scans(self, query, offset):
+        """Fetch a page from /api/scans using a pre-encoded query string.
         
-        for attempt in range(self.config.max_retries):
-            try:
-                headers = self.auth.get_headers()
-                response = requests.get(
-                    url, 
-                    headers=headers, 
-                    params=params,
-                    timeout=self.config.request_timeout
-                )
-                
-                if response.status_code == 429:
-                    # Rate limited - wait longer
-                    wait_time = 30
-                    if self.debug:
-                        print(f"    Rate limited. Waiting {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-                
-                response.raise_for_status()
-                return response.json()
-                
-            except requests.exceptions.Timeout:
-                if attempt < self.config.max_retries - 1:
-                    wait_time = self.config.retry_delay * (2 ** attempt)
-                    if self.logger:
-                        self.logger.log(f"API: Timeout on {url}. Retrying in {wait_time}s... (attempt {attempt + 1}/{self.config.max_retries})")
-                    if self.debug:
-                        print(f"    Timeout. Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    if self.logger:
-                        self.logger.log(f"API: Request timed out after {self.config.max_retries} attempts: {url}")
-                    if self.debug:
-                        print(f"    Request timed out after {self.config.max_retries} attempts")
-                    return None
-                    
-            except requests.exceptions.RequestException as e:
-                if attempt < self.config.max_retries - 1:
-                    wait_time = self.config.retry_delay * (2 ** attempt)
-                    if self.logger:
-                        self.logger.log(f"API: Error on {url}: {e}. Retrying in {wait_time}s... (attempt {attempt + 1}/{self.config.max_retries})")
-                    if self.debug:
-                        print(f"    Error: {e}. Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    if self.logger:
-                        self.logger.log(f"API: Request failed after {self.config.max_retries} attempts: {url} - {e}")
-                    if self.debug:
-                        print(f"    Request failed after {self.config.max_retries} attempts: {e}")
-                    return None
+        Scan discovery issues this request for every branch and page, so the
+        URL and the static part of the query are built once by the caller
+        instead of being re-encoded from a params dict on each call.
         
-        return None
+        Args:
+            query (str): URL-encoded query parameters, without offset
+            offset (int): Page offset
+            
+        Returns:
+            dict or list: Response data
+        """
+        return self._get_url(f"{self._scans_url}?{query}&offset={offset}")
+    
+    def _get_url(self, url, params=None, use_cache=True):
+        """Make a GET request to a full URL with retry logic.
+        
+        Args:
+            url (str): Full request URL
+            params (dict, optional): Query parameters
+            use_cache (bool): Whether to use the ETag cache for this request
+            
+        Returns:
+            dict or list: Response data
+        """
+        cache_key = None
+        if use_cache and self.http_cache:
+            cache_key = HTTPCache.make_key(url, params, self.config.tenant_name)
+        return self._request('GET', url, cache_key=cache_key, params=params)
     
     def post(self, endpoint, data=None, json_data=None):
         """Make a POST request with retry logic.
@@ -174,42 +239,7 @@ class APIClient:
         Returns:
             dict: Response data
         """
-        url = f"{self.base_url}{endpoint}"
-        
-        for attempt in range(self.config.max_retries):
-            try:
-                headers = self.auth.get_headers()
-                response = requests.post(
-                    url,
-                    headers=headers,
-                    data=data,
-                    json=json_data,
-                    timeout=self.config.request_timeout
-                )
-                
-                if response.status_code == 429:
-                    # Rate limited - wait longer
-                    wait_time = 30
-                    if self.debug:
-                        print(f"    Rate limited. Waiting {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-                
-                response.raise_for_status()
-                return response.json()
-                
-            except requests.exceptions.RequestException as e:
-                if attempt < self.config.max_retries - 1:
-                    wait_time = self.config.retry_delay * (2 ** attempt)
-                    if self.debug:
-                        print(f"    Error: {e}. Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    if self.debug:
-                        print(f"    Request failed after {self.config.max_retries} attempts: {e}")
-                    return None
-        
-        return None
+        return self._request('POST', f"{self.base_url}{endpoint}", data=data, json=json_data)
     
     def post_sca_export(self, endpoint, json_data=None):
         """Make a POST request for SCA export with specific headers.
@@ -221,45 +251,116 @@ class APIClient:
         Returns:
             dict: Response data
         """
-        url = f"{self.base_url}{endpoint}"
+        return self._request(
+            'POST', f"{self.base_url}{endpoint}",
+            extra_headers={'Accept': 'application/json; version=1.0'},
+            json=json_data
+        )
+    
+    def _request(self, method, url, extra_headers=None, cache_key=None, **kwargs):
+        """Send a request and decode its JSON response.
+        
+        Connection errors, timeouts and 5xx responses are retried with backoff
+        by the session's HTTPAdapter, and the request is sent again with
+        backoff if the adapter gives up or another transport error occurs.
+        429 responses are handled here so the shared rate limiter can slow
+        every worker down, a 401 re-authenticates, and a body that fails to
+        decode is requested again. Other 4xx responses fail immediately.
+        
+        Args:
+            method (str): HTTP method
+            url (str): Full request URL
+            extra_headers (dict, optional): Headers added to the auth headers
+            cache_key (str, optional): ETag cache key; None disables the cache
+            **kwargs: Passed through to Session.request
+            
+        Returns:
+            dict or list: Response data, or None on failure
+        """
+        cached = self.http_cache.get(cache_key) if cache_key else None
         
         for attempt in range(self.config.max_retries):
+            auth_headers = self.auth.get_headers()
+            headers = auth_headers
+            if extra_headers or cached:
+                headers = {**headers, **(extra_headers or {})}
+                if cached:
+                    headers['If-None-Match'] = cached[0]
+            
             try:
-                # Get base headers and add SCA-specific headers
-                headers = self.auth.get_headers()
-                headers['Accept'] = 'application/json; version=1.0'
-                
-                response = requests.post(
+                self.rate_limiter.acquire()
+                response = self.session.request(
+                    method,
                     url,
                     headers=headers,
-                    json=json_data,
-                    timeout=self.config.request_timeout
+                    timeout=self.config.request_timeout,
+                    **kwargs
                 )
                 
                 if response.status_code == 429:
-                    # Rate limited - wait longer
-                    wait_time = 30
+                    # Rate limited - slow down every worker via the shared limiter
+                    self.rate_limiter.on_throttle(parse_retry_after(response.headers.get('Retry-After')))
                     if self.debug:
-                        print(f"    Rate limited. Waiting {wait_time}s...")
-                    time.sleep(wait_time)
+                        print(f"    Rate limited. Reducing request rate to {self.rate_limiter.rate:.1f}/s...")
+                    continue
+                
+                if response.status_code == 401:
+                    # Token revoked or expired early - drop it and authenticate again
+                    self.auth.invalidate(auth_headers)
+                    if self.logger:
+                        self.logger.log(f"API: Unauthorized: {method} {url} (attempt {attempt + 1}/{self.config.max_retries})")
                     continue
                 
+                if response.status_code == 304 and cached:
+                    self.rate_limiter.on_success()
+                    return orjson.loads(cached[1])
+                
                 response.raise_for_status()
-                return response.json()
+                self.rate_limiter.on_success()
+                data = _decode_json(response)
+                
+                etag = response.headers.get('ETag')
+                if cache_key and etag and response.content:
+                    self.http_cache.put(cache_key, etag, response.content)
+                
+                return data
+                
+            except orjson.JSONDecodeError as e:
+                if self.logger:
+                    self.logger.log(f"API: Invalid JSON from {method} {url}: {e} (attempt {attempt + 1}/{self.config.max_retries})")
+                if self.debug:
+                    print(f"    Invalid JSON response: {e}")
                 
             except requests.exceptions.RequestException as e:
-                if attempt < self.config.max_retries - 1:
-                    wait_time = self.config.retry_delay * (2 ** attempt)
-                    if self.debug:
-                        print(f"    Error: {e}. Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
+                status = e.response.status_code if e.response is not None else None
+                if status is not None and 400 <= status < 500:
+                    # Client errors will not succeed on retry
+                    if self.logger:
+                        self.logger.log(f"API: Request failed: {method} {url} - {e}")
                     if self.debug:
-                        print(f"    Request failed after {self.config.max_retries} attempts: {e}")
+                        print(f"    Request failed: {e}")
                     return None
+                
+                if self.logger:
+                    self.logger.log(f"API: Error on {method} {url}: {e} (attempt {attempt + 1}/{self.config.max_retries})")
+                if self.debug:
+                    print(f"    Error: {e}")
+                if attempt < self.config.max_retries - 1:
+                    time.sleep(self.config.retry_delay * (2 ** attempt))
         
+        if self.logger:
+            self.logger.log(f"API: Request failed after {self.config.max_retries} attempts: {method} {url}")
+        if self.debug:
+            print(f"    Request failed after {self.config.max_retries} attempts")
         return None
     
+    def close(self):
+        """Close the HTTP cache and the pooled session."""
+        if self.http_cache:
+            self.http_cache.close()
+            self.http_cache = None
+        self.session.close()
+    
     def download_file(self, endpoint, output_path):
         """Download a file from an endpoint.
         
@@ -275,24 +376,30 @@ class APIClient:
         url = f"{self.base_url}{endpoint}"
         
         try:
-            # Ensure output directory exists
+            # Ensure output directory exists (once per directory, not per download)
             output_dir = os.path.dirname(output_path)
-            if output_dir and not os.path.exists(output_dir):
+            if output_dir and output_dir not in self._ensured_dirs:
                 os.makedirs(output_dir, exist_ok=True)
+                self._ensured_dirs.add(output_dir)
             
             headers = self.auth.get_headers()
-            response = requests.get(
+            self.rate_limiter.acquire()
+            response = self.session.get(
                 url,
                 headers=headers,
                 timeout=self.config.request_timeout,
                 stream=True
             )
-            response.raise_for_status()
-            
-            # Write file safely
-            with open(output_path, 'wb') as f:  # nosec - path is controlled by FileManager
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Closing the streamed response on every path returns its connection
+            # to the blocking pool, including when the status is an error
+            with response:
+                response.raise_for_status()
+                self.rate_limiter.on_success()
+                
+                # Copy the body in 1 MB blocks; decode_content undoes any gzip transfer encoding
+                response.raw.decode_content = True
+                with open(output_path, 'wb') as f:  # nosec - path is controlled by FileManager
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
             
             return True
             
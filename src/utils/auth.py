@@ -1,9 +1,13 @@
+import hashlib
+import os
 import sys
+import threading
 import time
+import orjson
 import requests
 
 class AuthManager:
-    def __init__(self, base_url, tenant_name, api_key, debug=False):
+    def __init__(self, base_url, tenant_name, api_key, debug=False, token_cache_dir=None):
         """Initialize the authentication manager.
         
         Args:
@@ -11,6 +15,8 @@ class AuthManager:
             tenant_name (str): The tenant name
             api_key (str): The API key for authentication
             debug (bool, optional): Enable debug output. Defaults to False.
+            token_cache_dir (str, optional): Directory where access tokens are
+                persisted between runs. Defaults to None (no persistence).
         """
         self.base_url = base_url
         self.tenant_name = tenant_name
@@ -18,8 +24,11 @@ class AuthManager:
         self.debug = debug
         self.auth_token = None
         self.token_expiration = 0
+        self._cached_headers = None
+        self._auth_lock = threading.Lock()
         self.iam_base_url = self._generate_iam_url()
         self.auth_url = self._generate_auth_url()
+        self.token_cache_path = self._generate_token_cache_path(token_cache_dir)
 
     def _generate_iam_url(self):
         """Generate the IAM URL from the base URL."""
@@ -29,10 +38,25 @@ class AuthManager:
         """Generate the authentication URL."""
         return f"{self.iam_base_url}/auth/realms/{self.tenant_name}/protocol/openid-connect/token"
 
+    def _generate_token_cache_path(self, token_cache_dir):
+        """Generate the token cache file path for this tenant and API key.
+        
+        The file name is a hash, so neither the tenant nor the key is exposed.
+        """
+        if not token_cache_dir:
+            return None
+        digest = hashlib.sha256(f"{self.auth_url}\0{self.api_key}".encode('utf-8')).hexdigest()
+        return os.path.join(os.path.expanduser(token_cache_dir), f"token_{digest}.json")
+
     def ensure_authenticated(self):
         """Ensure we have a valid authentication token."""
         if time.time() >= self.token_expiration - 60:
-            self._authenticate()
+            with self._auth_lock:
+                # Another thread may have refreshed the token while we waited
+                if time.time() >= self.token_expiration - 60:
+                    # A token saved by a previous run saves a round-trip on startup
+                    if self.auth_token is not None or not self._load_cached_token():
+                        self._authenticate()
         return self.auth_token
 
     def _authenticate(self):
@@ -52,12 +76,13 @@ class AuthManager:
             response.raise_for_status()
             
             json_response = response.json()
-            self.auth_token = json_response.get('access_token')
-            if not self.auth_token:
+            token = json_response.get('access_token')
+            if not token:
                 raise ValueError("No access token in response")
-                
+            
             expires_in = json_response.get('expires_in', 600)
-            self.token_expiration = time.time() + expires_in
+            self._set_token(token, time.time() + expires_in)
+            self._save_cached_token()
 
             if self.debug:
                 print("Authentication successful")
@@ -70,8 +95,91 @@ class AuthManager:
             sys.exit(1)
 
     def get_headers(self):
-        """Get headers with authentication token for API requests."""
-        return {
-            'Authorization': f'Bearer {self.ensure_authenticated()}',
+        """Get headers with authentication token for API requests.
+        
+        The returned dict is shared between calls and must not be modified;
+        copy it to add request-specific headers.
+        """
+        self.ensure_authenticated()
+        return self._cached_headers
+
+    def invalidate(self, headers=None):
+        """Drop the current token so the next request re-authenticates.
+        
+        Used when the API rejects a token before its stored expiry, e.g.
+        because it was revoked. The persisted copy is removed too, so later
+        runs do not reuse it.
+        
+        Args:
+            headers (dict, optional): Headers the rejected request was sent
+                with; the token is kept if it has already been replaced, so
+                concurrent rejections re-authenticate only once
+        """
+        with self._auth_lock:
+            if headers is not None and headers is not self._cached_headers:
+                return
+            self.token_expiration = 0
+            if self.token_cache_path:
+                try:
+                    os.remove(self.token_cache_path)
+                except OSError:
+                    pass
+        if self.debug:
+            print("Authentication token rejected; re-authenticating")
+
+    def _set_token(self, token, expiration):
+        """Store a token and build its request headers."""
+        self.auth_token = token
+        self.token_expiration = expiration
+        # Build request headers once per token rather than per request
+        self._cached_headers = {
+            'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json'
-        } 
\ No newline at end of file
+        }
+
+    def _load_cached_token(self):
+        """Load a still-valid token persisted by a previous run.
+        
+        Returns:
+            bool: True if a valid token was loaded
+        """
+        if not self.token_cache_path:
+            return False
+        try:
+            with open(self.token_cache_path, 'rb') as f:
+                cached = orjson.loads(f.read())
+            token = cached['token']
+            expiration = float(cached['exp'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        
+        if not token or time.time() >= expiration - 60:
+            return False
+        
+        self._set_token(token, expiration)
+        if self.debug:
+            print("Using cached authentication token")
+        return True
+
+    def _save_cached_token(self):
+        """Persist the current token so later runs can skip authentication.
+        
+        The file is created with mode 0600 and replaced atomically.
+        """
+        if not self.token_cache_path:
+            return
+        tmp_path = f"{self.token_cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.token_cache_path), mode=0o700, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps({'token': self.auth_token, 'exp': self.token_expiration}))
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.token_cache_path)
+        except OSError as e:
+            if self.debug:
+                print(f"Warning: Could not cache authentication token: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -1,58 +1,98 @@
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
+@lru_cache(maxsize=None)
+def _load_env(env_file):
+    """Load an environment file once per process.
+    
+    Args:
+        env_file (str): Path to environment file
+    """
+    load_dotenv(env_file)  # Load specified .env file if it exists
+
+# Optional environment overrides: (variable, Config attribute, converter)
+_ENV_OVERRIDES = (
+    ('CXONE_MAX_WORKERS', 'max_workers_reports', int),
+    ('CXONE_MAX_SCAN_WORKERS', 'max_workers_scans', int),
+    ('CXONE_MAX_MERGE_WORKERS', 'max_workers_merge', int),
+    ('CXONE_MAX_RPS', 'max_requests_per_second', float),
+    ('CXONE_OUTPUT_DIR', 'output_directory', str),
+    ('CXONE_FILTER_PACKAGES', 'filter_packages', str),
+    ('CXONE_CACHE_PATH', 'cache_path', str),
+    ('CXONE_HTTP_CACHE_PATH', 'http_cache_path', str),
+    ('CXONE_TOKEN_CACHE_DIR', 'token_cache_dir', str),
+)
+
 class Config:
+    """Tool configuration.
+    
+    Defaults are class attributes shared by all instances; an instance only
+    stores the values that are overridden from the environment or CLI.
+    """
+    
+    # General
+    debug = False
+    progress_bars = True  # tqdm bars; a plain progress line redrawn every 1% when False
+    
+    # Threading
+    max_workers_projects = 5
+    max_workers_branches = 20
+    max_workers_scans = 20
+    max_workers_reports = 10
+    max_workers_merge = min(4, os.cpu_count() or 1)  # Processes converting report archives
+    
+    # Batching
+    batch_size_branches = 100
+    batch_size_reports = 10
+    
+    # Rate limiting
+    report_generation_delay = 1.0
+    polling_interval = 5.0  # Initial polling interval
+    max_polling_time = 7200  # 2 hours in seconds
+    polling_max_wait = 120  # Cap wait time at 2 minutes
+    max_requests_per_second = 50.0  # Shared API request rate across all workers
+    rate_limit_cooldown = 5.0  # Pause after a 429 without Retry-After
+    
+    # API settings
+    max_retries = 3
+    retry_delay = 2.0
+    request_timeout = 60
+    page_size = 100
+    scan_page_prefetch = 3  # Scan pages fetched concurrently after the first page
+    scan_batch_max_pages = 3  # Project scan pages walked before falling back to per-branch queries
+    
+    # File paths
+    output_directory = "./output"
+    temp_directory = "./temp"
+    cache_path = "./cache/scan_packages"  # Persistent scan-id -> has-packages cache
+    http_cache_path = "./cache/http"  # ETag cache for conditional GET requests
+    http_cache_max_entries = 5000  # Least recently used responses are evicted beyond this
+    token_cache_dir = "~/.cxone"  # Access tokens reused across runs while valid
+    
+    # Output settings
+    output_filename_template = "sca_packages_{tenant}_{timestamp}.csv"
+    include_timestamp = True
+    
+    # Memory management
+    temp_file_cleanup = True
+    temp_orphan_cleanup = False  # Also remove .zip archives in temp_directory not created by this run
+    
+    # Error handling
+    continue_on_errors = True
+    log_errors_to_file = True
+    
+    # Package filtering
+    filter_packages = None
+    filter_packages_field = None
+    filter_packages_value = None
+    
     def __init__(self):
-        """Initialize configuration with default values."""
+        """Initialize configuration with per-instance values."""
         # Authentication
         self.base_url = None
         self.tenant_name = None
         self.api_key = None
-        
-        # General
-        self.debug = False
-        
-        # Threading
-        self.max_workers_projects = 5
-        self.max_workers_branches = 20
-        self.max_workers_scans = 20
-        self.max_workers_reports = 10
-        
-        # Batching
-        self.batch_size_branches = 100
-        self.batch_size_reports = 10
-        
-        # Rate limiting
-        self.report_generation_delay = 1.0
-        self.polling_interval = 5.0  # Initial polling interval
-        self.max_polling_time = 7200  # 2 hours in seconds
-        self.polling_max_wait = 120  # Cap wait time at 2 minutes
-        
-        # API settings
-        self.max_retries = 3
-        self.retry_delay = 2.0
-        self.request_timeout = 60
-        self.page_size = 100
-        
-        # File paths
-        self.output_directory = "./output"
-        self.temp_directory = "./temp"
-        
-        # Output settings
-        self.output_filename_template = "sca_packages_{tenant}_{timestamp}.csv"
-        self.include_timestamp = True
-        
-        # Memory management
-        self.temp_file_cleanup = True
-        
-        # Error handling
-        self.continue_on_errors = True
-        self.log_errors_to_file = True
-        
-        # Package filtering
-        self.filter_packages = None
-        self.filter_packages_field = None
-        self.filter_packages_value = None
 
     @classmethod
     def from_args(cls, args):
@@ -76,6 +116,8 @@ class Config:
         # Optional threading arguments
         if hasattr(args, 'max_workers') and args.max_workers:
             config.max_workers_reports = args.max_workers
+        if hasattr(args, 'max_scan_workers') and args.max_scan_workers:
+            config.max_workers_scans = args.max_scan_workers
             
         # Optional output directory
         if hasattr(args, 'output_dir') and args.output_dir:
@@ -90,7 +132,7 @@ class Config:
         Args:
             env_file (str): Path to environment file (default: '.env')
         """
-        load_dotenv(env_file)  # Load specified .env file if it exists
+        _load_env(env_file)
         
         config = cls()
         config.base_url = os.getenv('CXONE_BASE_URL')
@@ -98,13 +140,11 @@ class Config:
         config.api_key = os.getenv('CXONE_API_KEY')
         config.debug = os.getenv('CXONE_DEBUG', '').lower() == 'true'
         
-        # Optional environment overrides
-        if os.getenv('CXONE_MAX_WORKERS'):
-            config.max_workers_reports = int(os.getenv('CXONE_MAX_WORKERS'))
-        if os.getenv('CXONE_OUTPUT_DIR'):
-            config.output_directory = os.getenv('CXONE_OUTPUT_DIR')
-        if os.getenv('CXONE_FILTER_PACKAGES'):
-            config.filter_packages = os.getenv('CXONE_FILTER_PACKAGES')
+        # Optional environment overrides (each variable is read once)
+        for env_name, attr, convert in _ENV_OVERRIDES:
+            value = os.getenv(env_name)
+            if value:
+                setattr(config, attr, convert(value))
             
         return config
 
@@ -120,6 +160,8 @@ class Config:
             return False, "Tenant name is required"
         if not self.api_key:
             return False, "API key is required"
+        if self.max_requests_per_second <= 0:
+            return False, "Maximum requests per second must be greater than 0"
         
         # Validate filter criteria if provided
         if self.filter_packages:
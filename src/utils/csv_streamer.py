@@ -1,9 +1,357 @@
 """CSV streaming and merging utilities."""
 
 import csv
+import io
 import os
+import re
+import shutil
 import zipfile
 import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
+
+def _compile_predicate(filter_value):
+    """Compile filter criteria into a predicate over a lowercased cell value.
+    
+    Parsing happens once, so the per-row check is a single comparison, set
+    membership test or containment test. Values joined with && must all be
+    contained in the cell.
+    
+    Args:
+        filter_value (str): Filter criteria with OR (||) and AND (&&) support
+        
+    Returns:
+        callable: Function taking a lowercased cell value and returning bool
+    """
+    # Handle OR logic (||)
+    if '||' in filter_value:
+        or_conditions = frozenset(condition.strip().lower() for condition in filter_value.split('||'))
+        return or_conditions.__contains__
+    
+    # Handle AND logic (&&)
+    if '&&' in filter_value:
+        and_conditions = tuple(condition.strip().lower() for condition in filter_value.split('&&'))
+        return lambda value: all(condition in value for condition in and_conditions)
+    
+    # Simple equality check (case insensitive)
+    return filter_value.lower().__eq__
+
+def _filter_terms(filter_value):
+    """Get the lowercased values a matching cell must contain.
+    
+    A row can only match if its lowercased text contains one of these, which
+    allows most rows to be rejected with a substring search instead of being
+    parsed.
+    
+    Args:
+        filter_value (str): Filter criteria with OR (||) and AND (&&) support
+        
+    Returns:
+        tuple: Lowercased terms, or None if a raw-text search is not reliable
+    """
+    for separator in ('||', '&&'):
+        if separator in filter_value:
+            terms = tuple(condition.strip().lower() for condition in filter_value.split(separator))
+            break
+    else:
+        terms = (filter_value.lower(),)
+    
+    # Quotes are escaped in the raw text, so such terms cannot be searched for
+    if any('"' in term for term in terms):
+        return None
+    return terms
+
+# Metadata columns prepended to every package row, and their metadata keys
+METADATA_COLUMNS = ('ProjectName', 'ProjectId', 'BranchName', 'ScanId', 'ScanDate')
+METADATA_KEYS = ('project_name', 'project_id', 'branch_name', 'scan_id', 'scan_date')
+
+# Read size used when inflating Packages.csv
+ZIP_READ_BUFFER = 1 << 20
+
+# Archives converted ahead of the writer when merging without worker processes
+MERGE_PREFETCH_THREADS = 2
+
+# Outcomes of converting one report archive
+CONVERT_OK = 'ok'
+CONVERT_MISSING = 'missing'
+CONVERT_NO_PACKAGES = 'no_packages'
+CONVERT_EMPTY = 'empty'
+
+# Name of the packages entry in a report archive
+PACKAGES_CSV = 'Packages.csv'
+
+def _find_packages_csv(zip_ref, entry_name=PACKAGES_CSV):
+    """Locate Packages.csv in an open ZIP file.
+    
+    The expected entry name is tried first, which is a direct lookup; other
+    entries are only scanned when it is not there.
+    
+    Args:
+        zip_ref (ZipFile): Open ZIP file
+        entry_name (str): Entry name to try first, usually the one found in
+                          the previous archive of the merge
+        
+    Returns:
+        ZipInfo: Entry for Packages.csv, or None if not found
+    """
+    try:
+        return zip_ref.getinfo(entry_name)
+    except KeyError:
+        return next((info for info in zip_ref.infolist() if info.filename.endswith(PACKAGES_CSV)), None)
+
+@contextmanager
+def _open_packages_csv(zip_ref, info):
+    """Open Packages.csv inside a ZIP file as a text stream.
+    
+    Args:
+        zip_ref (ZipFile): Open ZIP file
+        info (ZipInfo): Entry for Packages.csv
+        
+    Yields:
+        TextIOWrapper: Decoded Packages.csv stream
+    """
+    # Inflate in large blocks rather than the text layer's default 8 KB reads
+    with zip_ref.open(info) as raw, \
+            io.BufferedReader(raw, buffer_size=ZIP_READ_BUFFER) as buffered, \
+            io.TextIOWrapper(buffered, encoding='utf-8', errors='replace', newline='') as text:
+        yield text
+
+def _iter_records(lines):
+    """Group source lines into complete CSV records.
+    
+    A line without quotes is always a whole record. A line with quotes may
+    start a quoted field spanning several lines, so csv.reader is used to
+    find where that record ends, pulling further lines only as needed. A
+    quote still open at the end of the input would swallow whatever follows
+    in the output, so that record is re-serialized with csv.writer instead.
+    
+    Args:
+        lines (iterable): Source lines
+        
+    Yields:
+        tuple: (record, row) where record is the raw text including its line
+               ending and row is the parsed fields, or None if not parsed
+    """
+    lines = iter(lines)
+    
+    for line in lines:
+        if '"' not in line:
+            yield line, None
+            continue
+        
+        consumed = [line]
+        unterminated = []
+        
+        def record_lines(first=line):
+            yield first
+            for next_line in lines:
+                consumed.append(next_line)
+                yield next_line
+            # csv.reader only asks past the last line while a quote is open
+            unterminated.append(True)
+        
+        row = next(csv.reader(record_lines()), [])
+        if unterminated:
+            output = io.StringIO()
+            csv.writer(output).writerow(row)
+            yield output.getvalue(), row
+        else:
+            yield ''.join(consumed), row
+
+def _format_prefix(metadata):
+    """Format the metadata columns of one file as a CSV fragment.
+    
+    Args:
+        metadata (dict): Report metadata
+        
+    Returns:
+        str: Quoted metadata fields joined by commas, without a line ending
+    """
+    output = io.StringIO()
+    # Quote exactly as csv.writer does for data rows, then drop its CRLF
+    csv.writer(output).writerow([metadata[key] for key in METADATA_KEYS])
+    return output.getvalue()[:-2]
+
+def _iter_raw_records(lines, metadata, counts):
+    """Yield source records verbatim with the metadata prefix prepended.
+    
+    Used when no filter applies: fields are never split or re-quoted, only
+    the pre-quoted metadata prefix is added. Record endings are normalized
+    to CRLF like csv.writer output. CRLF-terminated records are yielded as
+    separate prefix and record strings for writelines, so no per-row string
+    is built.
+    
+    Args:
+        lines (iterable): Source lines positioned after the header
+        metadata (dict): Report metadata for the file
+        counts (dict): Receives 'read' and 'filtered' row counts
+        
+    Yields:
+        str: Output text; concatenated, the pieces form each record
+    """
+    prefix = _format_prefix(metadata)
+    row_prefix = prefix + ','
+    read = 0
+    
+    # enumerate keeps the row count without a per-row increment
+    for read, (record, _) in enumerate(_iter_records(lines), 1):
+        if len(record) > 2 and record.endswith('\r\n'):
+            # Already CRLF-terminated: write prefix and record without joining them
+            yield row_prefix
+            yield record
+        else:
+            body = record.rstrip('\r\n')
+            # A blank source line is an empty row; csv.writer writes just the prefix
+            yield f"{row_prefix}{body}\r\n" if body else f"{prefix}\r\n"
+    
+    counts['read'] = read
+    counts['filtered'] = 0
+
+def _iter_filtered_records(lines, metadata, predicate, field_index, terms, counts):
+    """Yield matching source records verbatim with the metadata prefix prepended.
+    
+    A record whose lowercased text contains none of the filter terms cannot
+    match, so it is rejected by a substring search without being parsed as
+    long as it is plain (no quotes) and has enough commas to reach the filter
+    column. Remaining records are parsed to check the column itself. Rows
+    too short to have the column are kept, as in _apply_row_filter.
+    
+    Args:
+        lines (iterable): Source lines positioned after the header
+        metadata (dict): Report metadata for the file
+        predicate (callable): Compiled filter
+        field_index (int): Filter column index
+        terms (tuple): Terms from _filter_terms, or None to parse every record
+        counts (dict): Receives 'read' and 'filtered' row counts
+        
+    Yields:
+        str: Output text; concatenated, the pieces form each record
+    """
+    prefix = _format_prefix(metadata)
+    row_prefix = prefix + ','
+    read = 0
+    filtered = 0
+    
+    # Decide once how the terms are searched: a plain substring test for one
+    # term, a single compiled alternation for several
+    prescreen = terms is not None
+    single_term = terms[0] if prescreen and len(terms) == 1 else None
+    search_terms = None
+    if prescreen and single_term is None:
+        search_terms = re.compile('|'.join(map(re.escape, terms))).search
+    
+    for read, (record, row) in enumerate(_iter_records(lines), 1):
+        if row is None:
+            body = record.rstrip('\r\n')
+            if prescreen and body and body.count(',') >= field_index:
+                lowered = body.lower()
+                if not (single_term in lowered if single_term is not None else search_terms(lowered)):
+                    filtered += 1
+                    continue  # Skip this row
+            # Without quotes, splitting on commas is exactly what csv.reader does
+            row = body.split(',') if body else []
+        
+        if field_index < len(row) and not predicate(row[field_index].lower()):
+            filtered += 1
+            continue  # Skip this row
+        
+        if len(record) > 2 and record.endswith('\r\n'):
+            yield row_prefix
+            yield record
+        else:
+            body = record.rstrip('\r\n')
+            yield f"{row_prefix}{body}\r\n" if body else f"{prefix}\r\n"
+    
+    counts['read'] = read
+    counts['filtered'] = filtered
+
+def _convert_packages_zip(file_path, metadata, filter_field=None, filter_value=None, entry_name=PACKAGES_CSV, spool_dir=None):
+    """Convert the Packages.csv of one report archive into a spool file.
+    
+    Runs in a worker process, so it takes only picklable arguments and
+    reports problems through its status instead of logging them. Output
+    rows are written to a temporary file rather than returned, so memory use
+    does not grow with the size of the archive.
+    
+    Args:
+        file_path (str): Path to ZIP file
+        metadata (dict): Report metadata prepended to every row
+        filter_field (str, optional): Field to filter on
+        filter_value (str, optional): Filter criteria with OR (||) and AND (&&) support
+        entry_name (str): Entry name Packages.csv is expected under
+        spool_dir (str, optional): Directory for the spool file
+        
+    Returns:
+        tuple: (status, header, spool_path, rows_read, rows_filtered, entry_name)
+               where spool_path names the file holding the output rows without
+               the header (None unless status is CONVERT_OK; the caller
+               removes it) and entry_name is the name Packages.csv was found under
+    """
+    # Opening the archive doubles as the existence check, saving a stat per file
+    try:
+        zip_ref = zipfile.ZipFile(file_path, 'r', allowZip64=True)  # nosec - controlled path
+    except FileNotFoundError:
+        return CONVERT_MISSING, None, None, 0, 0, None
+    
+    with zip_ref:
+        info = _find_packages_csv(zip_ref, entry_name)
+        if info is None:
+            return CONVERT_NO_PACKAGES, None, None, 0, 0, None
+        
+        # Stream Packages.csv from the ZIP file without loading it into memory
+        with _open_packages_csv(zip_ref, info) as packages_file:
+            # Parse the CSV data as it is decompressed, one line at a time
+            reader = csv.reader(packages_file)
+            
+            # Read header
+            try:
+                header = next(reader)
+            except StopIteration:
+                return CONVERT_EMPTY, None, None, 0, 0, info.filename
+            
+            # Resolve the filter column once per file; rows are kept if it is missing
+            predicate = None
+            field_index = None
+            if filter_field and filter_value:
+                try:
+                    field_index = header.index(filter_field)
+                    predicate = _compile_predicate(filter_value)
+                except ValueError:
+                    pass
+            
+            # Records are copied without re-quoting; only filtered rows are parsed
+            counts = {'read': 0, 'filtered': 0}
+            if predicate is None:
+                records = _iter_raw_records(packages_file, metadata, counts)
+            else:
+                records = _iter_filtered_records(
+                    packages_file, metadata, predicate, field_index, _filter_terms(filter_value), counts
+                )
+            
+            fd, spool_path = tempfile.mkstemp(suffix='.csv', dir=spool_dir)
+            try:
+                with open(fd, 'w', newline='', encoding='utf-8', buffering=ZIP_READ_BUFFER) as spool:
+                    spool.writelines(records)
+            except BaseException:
+                os.remove(spool_path)
+                raise
+        
+    return CONVERT_OK, header, spool_path, counts['read'], counts['filtered'], info.filename
+
+def _remove_spool(result):
+    """Remove the spool file of a conversion result, if it has one.
+    
+    Args:
+        result (tuple): Tuple returned by _convert_packages_zip
+    """
+    if result[2]:
+        try:
+            os.remove(result[2])
+        except OSError:
+            pass
 
 class CSVStreamer:
     """Stream and merge CSV files efficiently."""
@@ -17,6 +365,8 @@ class CSVStreamer:
         """
         self.debug = debug
         self.logger = debug_logger
+        # Row counts of files written by merge_files: path -> (mtime_ns, size, rows)
+        self._merged_outputs = {}
     
     def _parse_filter_criteria(self, filter_string):
         """Parse filter criteria string into field and value components.
@@ -43,50 +393,32 @@ class CSVStreamer:
         
         return field_name, filter_value
     
-    def _apply_row_filter(self, row, field_name, filter_value, header):
+    def _apply_row_filter(self, row, field_index, predicate):
         """Apply filter logic to a single row.
         
+        The column index and the compiled predicate are resolved once per
+        file by the caller, so no header search happens per row.
+        
         Args:
             row (list): CSV row data
-            header (list): CSV header
-            field_name (str): Field to filter on
-            filter_value (str): Filter criteria with OR (||) and AND (&&) support
+            field_index (int): Index of the filter column, or None if the
+                               header has no such column
+            predicate (callable): Compiled filter from _compile_predicate
             
         Returns:
             bool: True if row matches filter, False otherwise
         """
-        try:
-            # Find field index in header
-            if field_name not in header:
-                return True  # Field not found, include row
-            
-            field_index = header.index(field_name)
-            if field_index >= len(row):
-                return True  # Row too short, include row
-            
-            cell_value = str(row[field_index]).lower()
-            
-            # Handle OR logic (||)
-            if '||' in filter_value:
-                or_conditions = [condition.strip().lower() for condition in filter_value.split('||')]
-                return any(cell_value == condition for condition in or_conditions)
-            
-            # Handle AND logic (&&)
-            elif '&&' in filter_value:
-                and_conditions = [condition.strip().lower() for condition in filter_value.split('&&')]
-                return all(cell_value == condition for condition in and_conditions)
-            
-            # Simple equality check (case insensitive)
-            else:
-                return cell_value == filter_value.lower()
-                
-        except (IndexError, ValueError, AttributeError):
-            # If any error in filtering, include the row
-            return True
+        if field_index is None or field_index >= len(row):
+            return True  # Field not found or row too short, include row
+        return predicate(row[field_index].lower())
     
-    def merge_files(self, file_metadata_list, output_path, exception_reporter=None, filter_criteria=None, progress_tracker=None):
+    def merge_files(self, file_metadata_list, output_path, exception_reporter=None, filter_criteria=None, progress_tracker=None, max_workers=1):
         """Merge multiple ZIP files (extracting Packages.csv) into one CSV.
         
+        Archives are decompressed, parsed and filtered in worker processes when
+        max_workers is greater than 1; the output is still written in input
+        order by this process.
+        
         Args:
             file_metadata_list (list): List of (file_path, metadata_dict) tuples
                                        where metadata_dict has: project_name, project_id, 
@@ -95,6 +427,7 @@ class CSVStreamer:
             exception_reporter (ExceptionReporter, optional): Exception reporter instance
             filter_criteria (str, optional): Filter criteria in format "field=value" with OR (||) and AND (&&) support
             progress_tracker (ProgressTracker, optional): Progress tracker instance for progress bar updates
+            max_workers (int): Number of worker processes used to convert archives
             
         Returns:
             tuple: (total_rows, files_processed, files_failed)
@@ -131,20 +464,21 @@ class CSVStreamer:
             raise ValueError("Invalid output path")
         
         with open(output_path, 'w', newline='', encoding='utf-8') as outfile:  # nosec B113 - validated path
-            writer = None
+            # Spool files go next to the output, so copying them stays on one filesystem
+            spool_dir = os.path.dirname(os.path.abspath(output_path))
+            results = self._iter_converted(file_metadata_list, filter_field, filter_value, max_workers, spool_dir)
             
-            for file_path, metadata in file_metadata_list:
+            for file_path, metadata, result in results:
                 try:
-                    if not os.path.exists(file_path):
+                    status, header, spool_path, read_rows, filtered_rows, _ = result()
+                    
+                    if status == CONVERT_MISSING:
                         if self.debug:
                             print(f"  Warning: File not found: {file_path}")
                         files_failed += 1
                         continue
                     
-                    # Extract Packages.csv from the ZIP file
-                    packages_data = self._extract_packages_from_zip(file_path)
-                    
-                    if not packages_data:
+                    if status == CONVERT_NO_PACKAGES:
                         warning_msg = f"No Packages.csv found in {file_path}"
                         if self.logger:
                             self.logger.log(f"  WARNING: {warning_msg} ({metadata['project_name']}/{metadata['branch_name']})")
@@ -161,13 +495,7 @@ class CSVStreamer:
                         files_failed += 1
                         continue
                     
-                    # Parse the CSV data
-                    reader = csv.reader(packages_data.splitlines())
-                    
-                    # Read header
-                    try:
-                        header = next(reader)
-                    except StopIteration:
+                    if status == CONVERT_EMPTY:
                         # Empty file
                         if self.debug:
                             print(f"  Warning: Empty Packages.csv in {file_path}")
@@ -186,9 +514,8 @@ class CSVStreamer:
                     if not header_written:
                         # Prepend metadata columns to header
                         header_columns = header
-                        output_header = ['ProjectName', 'ProjectId', 'BranchName', 'ScanId', 'ScanDate'] + header
-                        writer = csv.writer(outfile)
-                        writer.writerow(output_header)
+                        output_header = [*METADATA_COLUMNS, *header]
+                        csv.writer(outfile).writerow(output_header)
                         header_written = True
                     else:
                         # Verify header matches
@@ -197,30 +524,18 @@ class CSVStreamer:
                                 print(f"  Warning: Header mismatch in {file_path}")
                             # Continue anyway, but log it
                     
-                    # Write data rows with metadata columns prepended
-                    file_rows = 0
-                    filtered_rows = 0
-                    for row in reader:
-                        total_packages_before_filter += 1
-                        
-                        # Apply filter if enabled
-                        if filter_field and filter_value:
-                            if not self._apply_row_filter(row, filter_field, filter_value, header):
-                                filtered_rows += 1
-                                packages_filtered_out += 1
-                                continue  # Skip this row
-                        
-                        # Prepend metadata values to the row
-                        output_row = [
-                            metadata['project_name'],
-                            metadata['project_id'],
-                            metadata['branch_name'],
-                            metadata['scan_id'],
-                            metadata['scan_date']
-                        ] + row
-                        writer.writerow(output_row)
-                        file_rows += 1
-                        total_rows += 1
+                    # Rows arrive already formatted with metadata columns prepended,
+                    # so the spool file is copied as bytes in bounded blocks
+                    try:
+                        outfile.flush()
+                        with open(spool_path, 'rb') as spool:
+                            shutil.copyfileobj(spool, outfile.buffer, ZIP_READ_BUFFER)
+                    finally:
+                        os.remove(spool_path)
+                    file_rows = read_rows - filtered_rows
+                    total_packages_before_filter += read_rows
+                    packages_filtered_out += filtered_rows
+                    total_rows += file_rows
                     
                     if file_rows > 0:
                         log_msg = f"  Merged {file_rows} packages from {metadata['project_name']}/{metadata['branch_name']}"
@@ -265,6 +580,11 @@ class CSVStreamer:
                             packages=total_rows
                         )
         
+        # Remember the row count so validate_csv need not re-read the output
+        if header_written:
+            stat = os.stat(output_path)
+            self._merged_outputs[output_path] = (stat.st_mtime_ns, stat.st_size, total_rows)
+        
         # Log filtering summary if filtering was enabled
         if filter_field and filter_value and packages_filtered_out > 0:
             if self.logger:
@@ -274,37 +594,90 @@ class CSVStreamer:
         
         return total_rows, files_processed, files_failed, total_packages_before_filter, packages_filtered_out
     
-    def _extract_packages_from_zip(self, zip_path):
-        """Extract Packages.csv from a ZIP file.
+    def _iter_converted(self, file_metadata_list, filter_field, filter_value, max_workers, spool_dir=None):
+        """Convert report archives, yielding results in input order.
+        
+        With more than one worker, archives are converted in a process pool.
+        With a single worker, the next archives are read and inflated by
+        prefetch threads while the current one is written. Either way only a
+        bounded number of results is held ahead of the writer, and results
+        hold spool file paths rather than the converted rows.
         
         Args:
-            zip_path (str): Path to ZIP file
+            file_metadata_list (list): List of (file_path, metadata_dict) tuples
+            filter_field (str): Field to filter on, or None
+            filter_value (str): Filter criteria, or None
+            max_workers (int): Number of worker processes
+            spool_dir (str, optional): Directory for spool files
             
-        Returns:
-            str: Contents of Packages.csv, or None if not found
+        Yields:
+            tuple: (file_path, metadata, result) where calling result() returns
+                   the _convert_packages_zip tuple or raises its error
         """
-        try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:  # nosec - controlled path
-                # Look for Packages.csv in the ZIP
-                for file_info in zip_ref.filelist:
-                    if file_info.filename.endswith('Packages.csv'):
-                        # Extract and read the file
-                        with zip_ref.open(file_info.filename) as csv_file:
-                            return csv_file.read().decode('utf-8', errors='replace')
-                
-                # Packages.csv not found
-                return None
-                
-        except Exception as e:
-            if self.debug:
-                print(f"  Error extracting from ZIP {zip_path}: {e}")
-            return None
+        if len(file_metadata_list) <= 1:
+            for file_path, metadata in file_metadata_list:
+                yield file_path, metadata, partial(
+                    _convert_packages_zip, file_path, metadata, filter_field, filter_value, PACKAGES_CSV, spool_dir
+                )
+            return
+        
+        if max_workers > 1:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+            window = 2 * max_workers
+        else:
+            # Inflating and file reads release the GIL, so a thread overlaps
+            # the next archive's I/O with writing the current one
+            executor = ThreadPoolExecutor(max_workers=MERGE_PREFETCH_THREADS)
+            window = MERGE_PREFETCH_THREADS
+        
+        # Archives from one run share a layout, so the Packages.csv entry
+        # name found in a finished result is passed to later submissions
+        entry_name = PACKAGES_CSV
+        
+        def resolve(future):
+            nonlocal entry_name
+            converted = future.result()
+            if converted[-1]:
+                entry_name = converted[-1]
+            return converted
+        
+        with executor:
+            tasks = iter(file_metadata_list)
+            pending = deque()
+            
+            for file_path, metadata in tasks:
+                pending.append((file_path, metadata, executor.submit(
+                    _convert_packages_zip, file_path, metadata, filter_field, filter_value, entry_name, spool_dir
+                )))
+                if len(pending) >= window:
+                    break
+            
+            try:
+                while pending:
+                    file_path, metadata, future = pending.popleft()
+                    # Keep the pool busy while this result is written
+                    for next_path, next_metadata in islice(tasks, 1):
+                        pending.append((next_path, next_metadata, executor.submit(
+                            _convert_packages_zip, next_path, next_metadata, filter_field, filter_value, entry_name, spool_dir
+                        )))
+                    yield file_path, metadata, partial(resolve, future)
+            finally:
+                # Results the writer never took still own a spool file
+                for _, _, future in pending:
+                    if not future.cancel() and not future.exception():
+                        _remove_spool(future.result())
     
-    def validate_csv(self, file_path):
+    def validate_csv(self, file_path, fast=False):
         """Validate a CSV file.
         
+        Files written by merge_files and unchanged since are answered from the
+        row count recorded during the merge. Other files are counted by
+        scanning for line breaks, which is exact when the file has no quoted
+        fields (or when fast is set); otherwise they are parsed in full.
+        
         Args:
             file_path (str): Path to CSV file
+            fast (bool): Count line breaks even if quoted fields could span lines
             
         Returns:
             tuple: (is_valid, row_count, error_message)
@@ -314,6 +687,16 @@ class CSVStreamer:
             if not file_path or not isinstance(file_path, str):
                 return False, 0, "Invalid file path"
             
+            merged = self._merged_outputs.get(file_path)
+            if merged:
+                stat = os.stat(file_path)
+                if (stat.st_mtime_ns, stat.st_size) == merged[:2]:
+                    return True, merged[2], None
+            
+            counted = self._count_rows_fast(file_path, fast)
+            if counted is not None:
+                return counted
+            
             with open(file_path, 'r', encoding='utf-8', errors='replace') as f:  # nosec B113 - validated path
                 reader = csv.reader(f)
                 
@@ -330,4 +713,45 @@ class CSVStreamer:
                 
         except Exception as e:
             return False, 0, str(e)
-
+    
+    def _count_rows_fast(self, file_path, fast):
+        """Count data rows by scanning the raw file for line breaks.
+        
+        The file is read in large blocks and counted with bytes.count, so no
+        CSV parsing happens.
+        
+        Args:
+            file_path (str): Path to CSV file
+            fast (bool): Trust line breaks even if the file contains quotes
+            
+        Returns:
+            tuple: (is_valid, row_count, error_message), or None if the line
+                   count might differ from the CSV row count
+        """
+        newlines = 0
+        carriage_returns = 0
+        crlfs = 0
+        last_byte = b''
+        
+        with open(file_path, 'rb') as f:  # nosec B113 - validated path
+            for block in iter(partial(f.read, 1 << 20), b''):
+                # Quoted fields may contain line breaks, and a lone CR also
+                # ends a row, so only plain CRLF/LF files are counted this way
+                if not fast and b'"' in block:
+                    return None
+                newlines += block.count(b'\n')
+                carriage_returns += block.count(b'\r')
+                crlfs += block.count(b'\r\n')
+                if last_byte == b'\r' and block[:1] == b'\n':
+                    crlfs += 1  # CRLF split across blocks
+                last_byte = block[-1:]
+        
+        if not last_byte:
+            return False, 0, "Empty file"
+        if not fast and carriage_returns != crlfs:
+            return None
+        
+        if last_byte != b'\n':
+            newlines += 1  # Last row has no line ending
+        
+        return True, newlines - 1, None
@@ -1,8 +1,15 @@
 """Debug logging to file with live updates."""
 
 import sys
+import threading
+import time
 from datetime import datetime
 
+# Buffered log lines are flushed after this many messages or seconds (by a
+# timer if nothing else is logged), and immediately for warnings and errors
+FLUSH_EVERY = 256
+FLUSH_INTERVAL = 1.0
+
 class DebugLogger:
     """Logger that writes debug output to both console and file in real-time."""
     
@@ -16,30 +23,52 @@ class DebugLogger:
         self.log_file_path = log_file_path
         self.console_debug = console_debug
         self.file_handle = None
+        self._since_flush = 0
+        self._last_flush = time.monotonic()
+        self._flush_timer = None
+        self._lock = threading.Lock()
+        self._ts_second = None  # Second whose formatted prefix is cached
+        self._ts_prefix = ''
         
-        # Open file in write mode with line buffering for live updates
+        # Open file in write mode with a large buffer; log() flushes periodically
         try:
-            # nosec B113 B601 - controlled path, line buffering for live updates
-            self.file_handle = open(log_file_path, 'w', encoding='utf-8', buffering=1)
+            # nosec B113 B601 - controlled path
+            self.file_handle = open(log_file_path, 'w', encoding='utf-8', buffering=65536)
             self.log(f"Debug log started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             self.log("="*120)
         except Exception as e:
             print(f"Warning: Could not open debug log file: {e}")
     
+    def _timestamp(self):
+        """Format the current local time with millisecond precision.
+        
+        The date and time part only changes once per second, so it is
+        formatted once and reused; only the milliseconds are added per call.
+        
+        Returns:
+            str: Timestamp such as '2025-01-31 14:05:09.123'
+        """
+        now = time.time()
+        second = int(now)
+        if second != self._ts_second:
+            self._ts_prefix = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+            self._ts_second = second
+        return f"{self._ts_prefix}.{int((now - second) * 1000):03d}"
+    
     def log(self, message):
         """Write a message to the debug log.
         
         Args:
             message (str): Message to log
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-        log_line = f"[{timestamp}] {message}"
+        log_line = f"[{self._timestamp()}] {message}"
         
         # Write to file if handle is open
         if self.file_handle:
             try:
-                self.file_handle.write(log_line + '\n')
-                self.file_handle.flush()  # Force write to disk immediately
+                with self._lock:
+                    self.file_handle.write(log_line + '\n')
+                    self._maybe_flush(1, message)
             except Exception as e:
                 print(f"Warning: Failed to write to debug log: {e}")
         
@@ -47,13 +76,77 @@ class DebugLogger:
         if self.console_debug:
             print(message)
     
+    def log_many(self, messages):
+        """Write several messages to the debug log with a single write.
+        
+        Args:
+            messages (list): Messages to log, sharing one timestamp
+        """
+        if not messages:
+            return
+        
+        timestamp = self._timestamp()
+        
+        if self.file_handle:
+            try:
+                with self._lock:
+                    self.file_handle.write(''.join(f"[{timestamp}] {message}\n" for message in messages))
+                    self._maybe_flush(len(messages), *messages)
+            except Exception as e:
+                print(f"Warning: Failed to write to debug log: {e}")
+        
+        if self.console_debug:
+            print('\n'.join(messages))
+    
+    def _maybe_flush(self, count, *messages):
+        """Flush the log file every FLUSH_EVERY messages, every FLUSH_INTERVAL
+        seconds, or right away when a warning or error was written.
+        
+        Lines left in the buffer are flushed by a timer, so they reach the
+        file during quiet periods such as export polling. Called with the
+        lock held.
+        
+        Args:
+            count (int): Number of messages just written
+            *messages: Messages just written
+        """
+        self._since_flush += count
+        now = time.monotonic()
+        if (self._since_flush >= FLUSH_EVERY
+                or now - self._last_flush >= FLUSH_INTERVAL
+                or any(message.lstrip().startswith(('WARNING', 'ERROR')) for message in messages)):
+            self.file_handle.flush()
+            self._since_flush = 0
+            self._last_flush = now
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(FLUSH_INTERVAL, self._timed_flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _timed_flush(self):
+        """Flush lines still buffered when the flush timer fires."""
+        with self._lock:
+            self._flush_timer = None
+            if self.file_handle and self._since_flush:
+                try:
+                    self.file_handle.flush()
+                except Exception:
+                    pass
+                self._since_flush = 0
+                self._last_flush = time.monotonic()
+    
     def close(self):
         """Close the log file."""
         if self.file_handle:
             try:
                 self.log("="*120)
                 self.log(f"Debug log ended: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                self.file_handle.close()
+                with self._lock:
+                    if self._flush_timer is not None:
+                        self._flush_timer.cancel()
+                        self._flush_timer = None
+                    self.file_handle.flush()
+                    self.file_handle.close()
             except:
                 pass
             self.file_handle = None
@@ -1,8 +1,75 @@
 """Exception and summary reporting utilities."""
 
 import os
+from bisect import insort
+from collections import defaultdict
 from datetime import datetime
 
+# Rule printed above and below each report section heading
+SEPARATOR = "=" * 80 + "\n"
+
+# Summary statistics lines, formatted from ExceptionReporter.stats in one call each
+SUMMARY_TEMPLATE = (
+    "Total Projects:        {total_projects:,}\n"
+    "Total Branches:        {total_branches:,}\n"
+    "Scans Found:           {scans_found:,}\n"
+    "Scans Not Found:       {scans_not_found:,}\n"
+    "Reports Generated:     {reports_generated:,}\n"
+    "Reports Failed:        {reports_failed:,}\n"
+    "Total Packages:        {packages_merged:,}\n"
+)
+FILTER_SUMMARY_TEMPLATE = (
+    "Packages Filtered Out:    {packages_filtered_out:,}\n"
+    "Total Before Filtering:   {total_packages_before_filter:,}\n"
+)
+RUN_SUMMARY_TEMPLATE = (
+    "CSV Files Processed:   {files_processed:,}\n"
+    "CSV Files Failed:      {files_failed:,}\n"
+    "Execution Time:        {execution_time}\n"
+    "Output File:           {output_file}\n"
+)
+
+# One block per recorded entry; {index} is its 1-based position in the section
+REPORT_ERROR_TEMPLATE = (
+    "{index}. Project: {project}\n"
+    "   Branch: {branch}\n"
+    "   Scan ID: {scan_id}\n"
+    "   Scan Date: {scan_date}\n"
+    "   Error: {error}\n"
+    "\n"
+)
+ZIP_WARNING_TEMPLATE = (
+    "{index}. Project: {project}\n"
+    "   Branch: {branch}\n"
+    "   Scan ID: {scan_id}\n"
+    "   Warning: {warning}\n"
+    "\n"
+)
+SCAN_ERROR_TEMPLATE = (
+    "{index}. Project: {project}\n"
+    "   Branch: {branch}\n"
+    "   Error: {error}\n"
+    "\n"
+)
+API_ERROR_TEMPLATE = (
+    "{index}. Endpoint: {endpoint}\n"
+    "   Error: {error}\n"
+    "\n"
+)
+
+def _format_entries(template, entries):
+    """Format the report block of each recorded entry.
+    
+    Args:
+        template (str): Block template with an {index} field and the entry's keys
+        entries (list): Recorded entry dicts
+        
+    Yields:
+        str: Formatted block for each entry, in order
+    """
+    for index, entry in enumerate(entries, 1):
+        yield template.format(index=index, **entry)
+
 class ExceptionReporter:
     """Track and report exceptions, warnings, and summaries throughout execution."""
     
@@ -15,6 +82,12 @@ class ExceptionReporter:
         self.api_errors = []
         self.general_warnings = []
         
+        # Grouped as they are recorded, in the layout the report prints
+        self._branches_by_project = defaultdict(list)
+        self._warnings_by_category = defaultdict(list)
+        # Set by every add_* method; the report ends with a success note otherwise
+        self._has_issues = False
+        
         # Summary statistics
         self.stats = {
             'total_projects': 0,
@@ -35,13 +108,17 @@ class ExceptionReporter:
     
     def add_branch_no_sca(self, project_name, branch_name):
         """Record a branch with no SCA scans."""
+        self._has_issues = True
         self.branches_no_sca.append({
             'project': project_name,
             'branch': branch_name
         })
+        # Kept sorted as recorded so the report needs no per-project sort
+        insort(self._branches_by_project[project_name], branch_name)
     
     def add_scan_error(self, project_name, branch_name, error_message):
         """Record a scan-related error."""
+        self._has_issues = True
         self.scan_errors.append({
             'project': project_name,
             'branch': branch_name,
@@ -50,6 +127,7 @@ class ExceptionReporter:
     
     def add_report_generation_error(self, project_name, project_id, branch_name, scan_id, scan_date, error_message):
         """Record a report generation error with full metadata."""
+        self._has_issues = True
         self.report_generation_errors.append({
             'project': project_name,
             'project_id': project_id,
@@ -61,6 +139,7 @@ class ExceptionReporter:
     
     def add_zip_extraction_warning(self, project_name, branch_name, scan_id, warning_message):
         """Record a ZIP extraction warning."""
+        self._has_issues = True
         self.zip_extraction_warnings.append({
             'project': project_name,
             'branch': branch_name,
@@ -70,6 +149,7 @@ class ExceptionReporter:
     
     def add_api_error(self, endpoint, error_message):
         """Record an API error."""
+        self._has_issues = True
         self.api_errors.append({
             'endpoint': endpoint,
             'error': error_message
@@ -77,10 +157,12 @@ class ExceptionReporter:
     
     def add_general_warning(self, category, message):
         """Record a general warning."""
+        self._has_issues = True
         self.general_warnings.append({
             'category': category,
             'message': message
         })
+        self._warnings_by_category[category].append(message)
     
     def update_stats(self, **kwargs):
         """Update summary statistics."""
@@ -135,150 +217,104 @@ class ExceptionReporter:
         # Generate report filename (same as CSV but .txt)
         report_path = os.path.splitext(output_csv_path)[0] + '_report.txt'
         
-        # Build report content
-        lines = []
-        lines.append("=" * 80)
-        lines.append("CxOne SCA Package Aggregator - Execution Report")
-        lines.append("=" * 80)
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("")
-        
-        # === SUMMARY STATISTICS ===
-        lines.append("=" * 80)
-        lines.append("SUMMARY STATISTICS")
-        lines.append("=" * 80)
-        lines.append(f"Total Projects:        {self.stats['total_projects']:,}")
-        lines.append(f"Total Branches:        {self.stats['total_branches']:,}")
-        lines.append(f"Scans Found:           {self.stats['scans_found']:,}")
-        lines.append(f"Scans Not Found:       {self.stats['scans_not_found']:,}")
-        lines.append(f"Reports Generated:     {self.stats['reports_generated']:,}")
-        lines.append(f"Reports Failed:        {self.stats['reports_failed']:,}")
-        lines.append(f"Total Packages:        {self.stats['packages_merged']:,}")
-        if self.stats['packages_filtered_out'] > 0:
-            lines.append(f"Packages Filtered Out:    {self.stats['packages_filtered_out']:,}")
-            lines.append(f"Total Before Filtering:   {self.stats['total_packages_before_filter']:,}")
-        lines.append(f"CSV Files Processed:   {self.stats['files_processed']:,}")
-        lines.append(f"CSV Files Failed:      {self.stats['files_failed']:,}")
-        lines.append(f"Execution Time:        {self.stats['execution_time']}")
-        lines.append(f"Output File:           {self.stats['output_file']}")
-        if self.stats['output_size']:
-            lines.append(f"Output Size:           {self.stats['output_size']}")
-        lines.append("")
-        
-        # === BRANCHES WITHOUT SCA SCANS ===
-        if self.branches_no_sca:
-            lines.append("=" * 80)
-            lines.append(f"BRANCHES WITHOUT SCA SCANS ({len(self.branches_no_sca)})")
-            lines.append("=" * 80)
-            lines.append("")
+        # Stream the report straight to the file; the 1 MiB buffer batches the writes
+        with open(report_path, 'w', encoding='utf-8', buffering=1 << 20) as f:  # nosec B113 - controlled path
+            write = f.write
+            write(SEPARATOR)
+            write("CxOne SCA Package Aggregator - Execution Report\n")
+            write(SEPARATOR)
+            write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            write("\n")
             
-            # Group by project
-            by_project = {}
-            for item in self.branches_no_sca:
-                project = item['project']
-                if project not in by_project:
-                    by_project[project] = []
-                by_project[project].append(item['branch'])
+            # === SUMMARY STATISTICS ===
+            write(SEPARATOR)
+            write("SUMMARY STATISTICS\n")
+            write(SEPARATOR)
+            stats = self.stats
+            write(SUMMARY_TEMPLATE.format(**stats))
+            if stats['packages_filtered_out'] > 0:
+                write(FILTER_SUMMARY_TEMPLATE.format(**stats))
+            write(RUN_SUMMARY_TEMPLATE.format(**stats))
+            if stats['output_size']:
+                write(f"Output Size:           {stats['output_size']}\n")
+            write("\n")
             
-            for project in sorted(by_project.keys()):
-                lines.append(f"Project: {project}")
-                for branch in sorted(by_project[project]):
-                    lines.append(f"  - {branch}")
-                lines.append("")
-        
-        # === REPORT GENERATION ERRORS ===
-        if self.report_generation_errors:
-            lines.append("=" * 80)
-            lines.append(f"REPORT GENERATION ERRORS ({len(self.report_generation_errors)})")
-            lines.append("=" * 80)
-            lines.append("NOTE: See *_failed-reports.csv for full details and retry capability")
-            lines.append("")
+            # === BRANCHES WITHOUT SCA SCANS ===
+            if self.branches_no_sca:
+                write(SEPARATOR)
+                write(f"BRANCHES WITHOUT SCA SCANS ({len(self.branches_no_sca)})\n")
+                write(SEPARATOR)
+                write("\n")
+                
+                by_project = self._branches_by_project
+                for project in sorted(by_project):
+                    write(f"Project: {project}\n")
+                    for branch in by_project[project]:
+                        write(f"  - {branch}\n")
+                    write("\n")
             
-            for idx, error in enumerate(self.report_generation_errors, 1):
-                lines.append(f"{idx}. Project: {error['project']}")
-                lines.append(f"   Branch: {error['branch']}")
-                lines.append(f"   Scan ID: {error['scan_id']}")
-                lines.append(f"   Scan Date: {error['scan_date']}")
-                lines.append(f"   Error: {error['error']}")
-                lines.append("")
-        
-        # === ZIP EXTRACTION WARNINGS ===
-        if self.zip_extraction_warnings:
-            lines.append("=" * 80)
-            lines.append(f"ZIP EXTRACTION WARNINGS ({len(self.zip_extraction_warnings)})")
-            lines.append("=" * 80)
-            lines.append("")
+            # === REPORT GENERATION ERRORS ===
+            if self.report_generation_errors:
+                write(SEPARATOR)
+                write(f"REPORT GENERATION ERRORS ({len(self.report_generation_errors)})\n")
+                write(SEPARATOR)
+                write("NOTE: See *_failed-reports.csv for full details and retry capability\n")
+                write("\n")
+                
+                f.writelines(_format_entries(REPORT_ERROR_TEMPLATE, self.report_generation_errors))
             
-            for idx, warning in enumerate(self.zip_extraction_warnings, 1):
-                lines.append(f"{idx}. Project: {warning['project']}")
-                lines.append(f"   Branch: {warning['branch']}")
-                lines.append(f"   Scan ID: {warning['scan_id']}")
-                lines.append(f"   Warning: {warning['warning']}")
-                lines.append("")
-        
-        # === SCAN ERRORS ===
-        if self.scan_errors:
-            lines.append("=" * 80)
-            lines.append(f"SCAN ERRORS ({len(self.scan_errors)})")
-            lines.append("=" * 80)
-            lines.append("")
+            # === ZIP EXTRACTION WARNINGS ===
+            if self.zip_extraction_warnings:
+                write(SEPARATOR)
+                write(f"ZIP EXTRACTION WARNINGS ({len(self.zip_extraction_warnings)})\n")
+                write(SEPARATOR)
+                write("\n")
+                
+                f.writelines(_format_entries(ZIP_WARNING_TEMPLATE, self.zip_extraction_warnings))
             
-            for idx, error in enumerate(self.scan_errors, 1):
-                lines.append(f"{idx}. Project: {error['project']}")
-                lines.append(f"   Branch: {error['branch']}")
-                lines.append(f"   Error: {error['error']}")
-                lines.append("")
-        
-        # === API ERRORS ===
-        if self.api_errors:
-            lines.append("=" * 80)
-            lines.append(f"API ERRORS ({len(self.api_errors)})")
-            lines.append("=" * 80)
-            lines.append("")
+            # === SCAN ERRORS ===
+            if self.scan_errors:
+                write(SEPARATOR)
+                write(f"SCAN ERRORS ({len(self.scan_errors)})\n")
+                write(SEPARATOR)
+                write("\n")
+                
+                f.writelines(_format_entries(SCAN_ERROR_TEMPLATE, self.scan_errors))
             
-            for idx, error in enumerate(self.api_errors, 1):
-                lines.append(f"{idx}. Endpoint: {error['endpoint']}")
-                lines.append(f"   Error: {error['error']}")
-                lines.append("")
-        
-        # === GENERAL WARNINGS ===
-        if self.general_warnings:
-            lines.append("=" * 80)
-            lines.append(f"GENERAL WARNINGS ({len(self.general_warnings)})")
-            lines.append("=" * 80)
-            lines.append("")
+            # === API ERRORS ===
+            if self.api_errors:
+                write(SEPARATOR)
+                write(f"API ERRORS ({len(self.api_errors)})\n")
+                write(SEPARATOR)
+                write("\n")
+                
+                f.writelines(_format_entries(API_ERROR_TEMPLATE, self.api_errors))
             
-            # Group by category
-            by_category = {}
-            for warning in self.general_warnings:
-                category = warning['category']
-                if category not in by_category:
-                    by_category[category] = []
-                by_category[category].append(warning['message'])
+            # === GENERAL WARNINGS ===
+            if self.general_warnings:
+                write(SEPARATOR)
+                write(f"GENERAL WARNINGS ({len(self.general_warnings)})\n")
+                write(SEPARATOR)
+                write("\n")
+                
+                by_category = self._warnings_by_category
+                for category in sorted(by_category):
+                    write(f"Category: {category}\n")
+                    for message in by_category[category]:
+                        write(f"  - {message}\n")
+                    write("\n")
             
-            for category in sorted(by_category.keys()):
-                lines.append(f"Category: {category}")
-                for message in by_category[category]:
-                    lines.append(f"  - {message}")
-                lines.append("")
-        
-        # === SUCCESS SUMMARY ===
-        if not (self.branches_no_sca or self.report_generation_errors or 
-                self.zip_extraction_warnings or self.scan_errors or 
-                self.api_errors or self.general_warnings):
-            lines.append("=" * 80)
-            lines.append("NO ERRORS OR WARNINGS")
-            lines.append("=" * 80)
-            lines.append("All operations completed successfully!")
-            lines.append("")
-        
-        lines.append("=" * 80)
-        lines.append("END OF REPORT")
-        lines.append("=" * 80)
-        
-        # Write to file
-        with open(report_path, 'w', encoding='utf-8') as f:  # nosec B113 - controlled path
-            f.write('\n'.join(lines))
+            # === SUCCESS SUMMARY ===
+            if not self._has_issues:
+                write(SEPARATOR)
+                write("NO ERRORS OR WARNINGS\n")
+                write(SEPARATOR)
+                write("All operations completed successfully!\n")
+                write("\n")
+            
+            write(SEPARATOR)
+            write("END OF REPORT\n")
+            write(SEPARATOR)
         
         return report_path
 
@@ -1,9 +1,13 @@
 """File management utilities."""
 
+import errno
 import os
 import shutil
 from datetime import datetime
 
+# Path separators that cannot appear in a temp file name
+_BRANCH_NAME_TABLE = str.maketrans('/\\', '__')
+
 class FileManager:
     """Manage temporary and output files."""
     
@@ -16,7 +20,12 @@ class FileManager:
         """
         self.config = config
         self.debug = debug
-        self.temp_files = []
+        self.temp_files = set()  # A retried scan maps to the same path; track it once
+        # One run timestamp, so every output file of the run shares it
+        self._timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Directory prefixes ending in a separator, so file paths are a single concatenation
+        self._temp_prefix = os.path.join(config.temp_directory, '')
+        self._output_prefix = os.path.join(config.output_directory, '')
     
     def setup_directories(self):
         """Create necessary directories."""
@@ -39,10 +48,9 @@ class FileManager:
             str: Full path to temp file
         """
         # Sanitize branch name for filesystem
-        safe_branch = branch_name.replace('/', '_').replace('\\', '_')
-        filename = f"{scan_id}_{safe_branch}.zip"
-        path = os.path.join(self.config.temp_directory, filename)
-        self.temp_files.append(path)
+        safe_branch = branch_name.translate(_BRANCH_NAME_TABLE)
+        path = f"{self._temp_prefix}{scan_id}_{safe_branch}.zip"
+        self.temp_files.add(path)
         return path
     
     def get_output_file_path(self):
@@ -51,17 +59,11 @@ class FileManager:
         Returns:
             str: Full path to output file
         """
-        if not hasattr(self, '_output_path'):
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            
-            filename = self.config.output_filename_template.format(
-                tenant=self.config.tenant_name,
-                timestamp=timestamp
-            )
-            
-            self._output_path = os.path.join(self.config.output_directory, filename)
-        
-        return self._output_path
+        filename = self.config.output_filename_template.format(
+            tenant=self.config.tenant_name,
+            timestamp=self._timestamp
+        )
+        return self._output_prefix + filename
     
     def get_debug_log_path(self):
         """Generate the debug log file path.
@@ -79,28 +81,61 @@ class FileManager:
                 print("Skipping temp file cleanup (disabled in config)")
             return
         
+        # Only this run's archives are removed; the temp directory may be shared
+        # with other runs still downloading. A missing file needs no stat first.
         removed_count = 0
         for file_path in self.temp_files:
             try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    removed_count += 1
+                os.remove(file_path)
+                removed_count += 1
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 if self.debug:
                     print(f"Failed to remove {file_path}: {e}")
         
-        # Remove temp directory if empty
+        if self.config.temp_orphan_cleanup:
+            removed_count += self._remove_orphan_archives()
+        
+        # Remove temp directory if empty; rmdir itself refuses a non-empty one
         try:
-            if os.path.exists(self.config.temp_directory):
-                if not os.listdir(self.config.temp_directory):
-                    os.rmdir(self.config.temp_directory)
-        except Exception as e:
-            if self.debug:
+            os.rmdir(self.config.temp_directory)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            if e.errno not in (errno.ENOTEMPTY, errno.EEXIST) and self.debug:
                 print(f"Failed to remove temp directory: {e}")
         
         if self.debug:
             print(f"Cleaned up {removed_count} temporary files")
     
+    def _remove_orphan_archives(self):
+        """Remove report archives left in the temp directory by earlier runs.
+        
+        Only used when enabled explicitly, since it also removes the archives
+        of any other run sharing the temp directory.
+        
+        Returns:
+            int: Number of files removed
+        """
+        removed_count = 0
+        try:
+            with os.scandir(self.config.temp_directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.zip') and entry.is_file(follow_symlinks=False):
+                        try:
+                            os.remove(entry.path)
+                            removed_count += 1
+                        except Exception as e:
+                            if self.debug:
+                                print(f"Failed to remove {entry.path}: {e}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            if self.debug:
+                print(f"Failed to scan temp directory: {e}")
+        return removed_count
+    
     def get_temp_files(self):
         """Get list of all temporary files.
         
@@ -0,0 +1,139 @@
+"""Persistent HTTP response cache for conditional GET requests."""
+
+import os
+import shelve
+import threading
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+# Key under which the least-recently-used order is persisted
+_ORDER_KEY = '\0order'
+
+class HTTPCache:
+    """Store response bodies with their ETag so repeat GETs can be revalidated.
+
+    The cache holds at most max_entries responses; the least recently used
+    ones are evicted first.
+    """
+
+    def __init__(self, cache_path, debug=False, max_entries=5000):
+        """Initialize the HTTP cache.
+
+        Args:
+            cache_path (str): Path of the cache database
+            debug (bool): Enable debug output
+            max_entries (int): Maximum number of cached responses
+        """
+        self.cache_path = cache_path
+        self.debug = debug
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        cache_dir = os.path.dirname(cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._store = shelve.open(cache_path)  # nosec B301 - local cache written by this tool
+        self._order = self._load_order()
+        self._evict()
+
+    def _load_order(self):
+        """Load the persisted LRU order, reconciled with the stored keys.
+
+        Entries written by a run that did not close the cache are missing
+        from the order; they are treated as least recently used.
+
+        Returns:
+            OrderedDict: Cache keys from least to most recently used
+        """
+        try:
+            saved = self._store.get(_ORDER_KEY) or ()
+        except Exception:
+            saved = ()
+        keys = set(self._store.keys())
+        keys.discard(_ORDER_KEY)
+        order = OrderedDict.fromkeys(keys.difference(saved))
+        order.update((key, None) for key in saved if key in keys)
+        return order
+
+    def _evict(self):
+        """Drop least recently used entries beyond max_entries."""
+        while len(self._order) > self.max_entries:
+            key, _ = self._order.popitem(last=False)
+            try:
+                del self._store[key]
+            except Exception:
+                pass
+
+    @staticmethod
+    def make_key(url, params=None, tenant=None):
+        """Build a cache key from a request URL, its query parameters and tenant.
+
+        Region hosts are shared by tenants, so the tenant is part of the key
+        to keep one tenant's responses from being served to another.
+
+        Args:
+            url (str): Request URL
+            params (dict, optional): Query parameters
+            tenant (str, optional): Tenant the request is made for
+
+        Returns:
+            str: Cache key
+        """
+        if params:
+            url = f"{url}?{urlencode(sorted(params.items()), doseq=True)}"
+        return f"{tenant}\0{url}" if tenant else url
+
+    def get(self, key):
+        """Look up a cached response.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            tuple: (etag, body) or None if not cached
+        """
+        with self._lock:
+            if self._store is None:
+                return None
+            try:
+                cached = self._store.get(key)
+            except Exception:
+                return None
+            if cached is not None and key in self._order:
+                self._order.move_to_end(key)
+            return cached
+
+    def put(self, key, etag, body):
+        """Store a response body with its ETag.
+
+        Args:
+            key (str): Cache key
+            etag (str): ETag header value
+            body (bytes): Response body
+        """
+        with self._lock:
+            if self._store is None:
+                return
+            try:
+                self._store[key] = (etag, body)
+            except Exception as e:
+                if self.debug:
+                    print(f"    Failed to cache response for {key}: {e}")
+                return
+            self._order[key] = None
+            self._order.move_to_end(key)
+            self._evict()
+
+    def close(self):
+        """Save the LRU order, then flush and close the cache."""
+        with self._lock:
+            if self._store is not None:
+                try:
+                    self._store[_ORDER_KEY] = list(self._order)
+                except Exception:
+                    pass
+                try:
+                    self._store.close()
+                except Exception:
+                    pass
+                self._store = None
@@ -1,19 +1,92 @@
 """Progress tracking utilities."""
 
-from tqdm import tqdm
 import sys
+import time
+
+# Postfix values are re-rendered at most this often (seconds)
+POSTFIX_MIN_INTERVAL = 0.1
+
+# Rule printed around stage headings
+STAGE_SEPARATOR = "=" * 120
+
+class _PlainBar:
+    """Lightweight stand-in for tqdm that redraws only every 1% of the total.
+    
+    Updates are a counter increment until the next redraw is due, and
+    postfix values are only formatted when the line is redrawn.
+    """
+    
+    __slots__ = ('n', 'total', 'desc', 'unit', 'step', 'next_redraw', 'postfix', 'width', 'file')
+    
+    def __init__(self, total, desc, unit, file):
+        """Initialize the bar.
+        
+        Args:
+            total (int): Total number of items
+            desc (str): Description of the operation
+            unit (str): Unit name for items
+            file (file): Stream the bar is written to
+        """
+        self.n = 0
+        self.total = total
+        self.desc = desc
+        self.unit = unit
+        self.step = max(1, total // 100)
+        self.next_redraw = self.step
+        self.postfix = None
+        self.width = 0
+        self.file = file
+        self._redraw()
+    
+    def update(self, n=1):
+        """Advance the bar, redrawing it once per step."""
+        self.n += n
+        if self.n >= self.next_redraw:
+            self.next_redraw = self.n + self.step
+            self._redraw()
+    
+    def set_postfix(self, **kwargs):
+        """Store postfix values; they are shown on the next redraw."""
+        self.postfix = kwargs
+    
+    def write(self, message):
+        """Print a message on its own line and redraw the bar below it."""
+        self.file.write(f"\r{message.ljust(self.width)}\n")
+        self._redraw()
+    
+    def close(self):
+        """Draw the final state and end the line."""
+        self._redraw()
+        self.file.write("\n")
+        self.file.flush()
+    
+    def _redraw(self):
+        """Rewrite the progress line in place."""
+        percent = self.n * 100 // self.total if self.total else 100
+        line = f"{self.desc}: {percent:3d}% {self.n}/{self.total} {self.unit}"
+        if self.postfix:
+            line += " [" + ", ".join(f"{key}={value}" for key, value in self.postfix.items()) + "]"
+        # Pad over the previous line in case this one is shorter
+        self.file.write(f"\r{line.ljust(self.width)}")
+        self.file.flush()
+        self.width = len(line)
+
 
 class ProgressTracker:
     """Track and display progress for long-running operations."""
     
-    def __init__(self, debug=False):
+    def __init__(self, debug=False, plain=False):
         """Initialize the progress tracker.
         
         Args:
             debug (bool): Enable debug output
+            plain (bool): Use a plain text progress line instead of tqdm bars
         """
         self.debug = debug
+        self.plain = plain
         self.current_bar = None
+        self._last_postfix = 0.0
+        self._pending_postfix = None
     
     def create_bar(self, total, description, unit='items'):
         """Create a new progress bar.
@@ -28,6 +101,15 @@ class ProgressTracker:
         """
         if self.current_bar:
             self.current_bar.close()
+        self._last_postfix = 0.0
+        self._pending_postfix = None
+        
+        if self.plain:
+            self.current_bar = _PlainBar(total, description, unit, sys.stdout)
+            return self.current_bar
+        
+        # Imported on first use; runs with --no-progress never load tqdm
+        from tqdm import tqdm
         
         self.current_bar = tqdm(
             total=total,
@@ -48,18 +130,33 @@ class ProgressTracker:
             self.current_bar.update(n)
     
     def close(self):
-        """Close the current progress bar."""
+        """Close the current progress bar, showing the latest postfix values."""
         if self.current_bar:
+            if self._pending_postfix is not None:
+                self.current_bar.set_postfix(**self._pending_postfix)
+                self._pending_postfix = None
             self.current_bar.close()
             self.current_bar = None
     
     def set_postfix(self, **kwargs):
         """Set postfix values for the progress bar.
         
+        tqdm re-renders the bar on every call, so this is throttled to
+        POSTFIX_MIN_INTERVAL; values set in between are kept and shown when
+        the bar is closed, so the final numbers are always displayed. The
+        plain bar only stores the values and is updated directly.
+        
         Args:
             **kwargs: Key-value pairs to display
         """
         if self.current_bar:
+            if not self.plain:
+                now = time.monotonic()
+                if now - self._last_postfix < POSTFIX_MIN_INTERVAL:
+                    self._pending_postfix = kwargs
+                    return
+                self._last_postfix = now
+                self._pending_postfix = None
             self.current_bar.set_postfix(**kwargs)
     
     def print(self, message):
@@ -92,9 +189,8 @@ class StageTracker:
         Args:
             stage_name (str): Name of the stage
         """
-        print(f"\n{'='*120}")
-        print(f"{stage_name}")
-        print(f"{'='*120}")
+        sys.stdout.write(f"\n{STAGE_SEPARATOR}\n{stage_name}\n{STAGE_SEPARATOR}\n")
+        sys.stdout.flush()
         self.stats[stage_name] = {}
     
     def end_stage(self, stage_name, **stats):
@@ -106,9 +202,10 @@ class StageTracker:
         """
         self.stats[stage_name].update(stats)
         
-        print(f"\n{stage_name} completed:")
-        for key, value in stats.items():
-            print(f"  - {key}: {value}")
+        lines = [f"\n{stage_name} completed:"]
+        lines.extend(f"  - {key}: {value}" for key, value in stats.items())
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     def get_stats(self):
         """Get all recorded statistics.
@@ -120,12 +217,11 @@ class StageTracker:
     
     def print_summary(self):
         """Print a summary of all stages."""
-        print(f"\n{'='*120}")
-        print("SUMMARY")
-        print(f"{'='*120}")
-        
+        # Built as one string so the summary is a single console write
+        lines = [f"\n{STAGE_SEPARATOR}", "SUMMARY", STAGE_SEPARATOR]
         for stage, stats in self.stats.items():
-            print(f"\n{stage}:")
-            for key, value in stats.items():
-                print(f"  - {key}: {value}")
+            lines.append(f"\n{stage}:")
+            lines.extend(f"  - {key}: {value}" for key, value in stats.items())
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
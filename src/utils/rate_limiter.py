@@ -0,0 +1,81 @@
+"""Shared request rate limiting."""
+
+import threading
+import time
+
+class RateLimiter:
+    """Token bucket shared by all worker threads, with AIMD rate adjustment.
+
+    The rate is halved whenever the API answers 429 and grows back slowly on
+    successful requests, so workers throttle together instead of each one
+    sleeping independently.
+    """
+
+    def __init__(self, max_rate, min_rate=1.0, cooldown=5.0):
+        """Initialize the rate limiter.
+
+        Args:
+            max_rate (float): Maximum requests per second
+            min_rate (float): Lower bound for the rate after throttling
+            cooldown (float): Seconds all requests pause after a 429 without Retry-After
+        """
+        self.max_rate = float(max_rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.cooldown = cooldown
+        self.rate = self.max_rate
+        self._increase = self.max_rate / 100
+        self._tokens = self.max_rate
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    wait_time = self._blocked_until - now
+                else:
+                    # Refill tokens for elapsed time, capped at one second of burst
+                    self._tokens = min(self.rate, self._tokens + (now - self._last_refill) * self.rate)
+                    self._last_refill = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+    def on_success(self):
+        """Additively increase the rate after a successful request."""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self._increase)
+
+    def on_throttle(self, retry_after=None):
+        """Multiplicatively decrease the rate after a 429 response.
+
+        Args:
+            retry_after (float, optional): Seconds from the Retry-After header
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0
+            self._last_refill = now
+            pause = retry_after if retry_after is not None else self.cooldown
+            self._blocked_until = max(self._blocked_until, now + pause)
+
+def parse_retry_after(value):
+    """Parse a Retry-After header given in seconds.
+
+    Args:
+        value (str): Header value
+
+    Returns:
+        float: Seconds to wait, or None if absent or not numeric
+    """
+    try:
+        return max(0.0, float(value)) if value else None
+    except (TypeError, ValueError):
+        return None